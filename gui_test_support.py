@@ -0,0 +1,22 @@
+"""
+Shared helpers for the interactive GUI test scripts.
+"""
+
+import os
+import time
+
+# Seconds the event loop is pumped before closing in headless runs
+_HEADLESS_SECONDS = 3
+
+
+def run_gui(root):
+    """Run root's main loop, or pump it briefly and close when SMARTHOME_HEADLESS is set."""
+    if os.environ.get('SMARTHOME_HEADLESS'):
+        # Pump the event loop for a few seconds and close, so unattended runs finish
+        deadline = time.monotonic() + _HEADLESS_SECONDS
+        while time.monotonic() < deadline:
+            root.update()
+            time.sleep(0.01)
+        root.destroy()
+    else:
+        root.mainloop()
@@ -13,6 +13,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from gui.system_view import SystemView
 from simulation.engine import SimulationEngine
+from src.sensors.common_sensors import TemperatureSensor, MotionSensor, DoorWindowSensor, LightSensor
+from gui_test_support import run_gui
 import logging
 
 def test_enhanced_drag_functionality():
@@ -32,17 +34,12 @@ def test_enhanced_drag_functionality():
     engine = SimulationEngine()
     
     # Add some test sensors to make it more interesting
-    from src.sensors.temperature_sensor import TemperatureSensor
-    from src.sensors.motion_sensor import MotionSensor
-    from src.sensors.door_window_sensor import DoorWindowSensor
     
-    temp_sensor = TemperatureSensor("temp_01", "Living Room Temperature")
-    motion_sensor = MotionSensor("motion_01", "Hallway Motion")
-    door_sensor = DoorWindowSensor("door_01", "Front Door")
+    temp_sensor = TemperatureSensor(sensor_id="temp_01", name="Living Room Temperature")
+    motion_sensor = MotionSensor(sensor_id="motion_01", name="Hallway Motion")
+    door_sensor = DoorWindowSensor(sensor_id="door_01", name="Front Door")
     
-    engine.add_sensor(temp_sensor)
-    engine.add_sensor(motion_sensor)
-    engine.add_sensor(door_sensor)
+    engine.add_sensors([temp_sensor, motion_sensor, door_sensor])
     
     # Create system view
     system_view = SystemView(root, engine, logger)
@@ -61,8 +58,8 @@ def test_enhanced_drag_functionality():
        • Controllers: Data Filters and Aggregators (diamonds/circles)
     
     2. REAL-TIME ARROW UPDATES:
-       • Arrows clear immediately when dragging starts
-       • Arrows redraw in real-time during drag operations
+       • Arrows touching a dragged component follow it in real-time
+       • Arrows are redrawn cleanly when the drag ends
        • Color-coded: HTTP (red), MQTT (teal), DATA (blue)
     
     3. RIGHT-CLICK MENUS:
@@ -115,9 +112,8 @@ def test_enhanced_drag_functionality():
     ttk.Label(component_row, text="Add:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
     
     def add_test_sensor():
-        from src.sensors.light_sensor import LightSensor
         sensor_count = len([s for s in engine.get_sensors().values() if s.get_sensor_type() == 'light'])
-        light_sensor = LightSensor(f"light_{sensor_count:02d}", f"Light Sensor {sensor_count + 1}")
+        light_sensor = LightSensor(sensor_id=f"light_{sensor_count:02d}", name=f"Light Sensor {sensor_count + 1}")
         engine.add_sensor(light_sensor)
         system_view.refresh_diagram()
         print(f"✓ Added {light_sensor.name}")
@@ -142,7 +138,7 @@ def test_enhanced_drag_functionality():
     def test_sensor_data():
         sensors = engine.get_sensors()
         if sensors:
-            sensor = list(sensors.values())[0]
+            sensor = next(iter(sensors.values()))
             try:
                 data = sensor.read_data()
                 print(f"✓ {sensor.name}: {data}")
@@ -154,7 +150,7 @@ def test_enhanced_drag_functionality():
     def toggle_first_sensor():
         sensors = engine.get_sensors()
         if sensors:
-            sensor = list(sensors.values())[0]
+            sensor = next(iter(sensors.values()))
             sensor.is_active = not sensor.is_active
             system_view.refresh_diagram()
             print(f"✓ {sensor.name} {'activated' if sensor.is_active else 'deactivated'}")
@@ -173,30 +169,46 @@ def test_enhanced_drag_functionality():
     status_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
     status_scroll.pack(side=tk.RIGHT, fill=tk.Y)
     
+    last_state = None
+    
     def update_status_display():
-        status_text.delete(1.0, tk.END)
+        nonlocal last_state
+        canvas_components = system_view.canvas_components
+        
+        # Cheap fingerprint of what the pane shows: (name, state, position) per entity
+        components = tuple(
+            (comp.name, comp.status.value, canvas_components.get(comp_id, {}).get('position', (0, 0)))
+            for comp_id, comp in system_view.component_manager.components.items())
+        sensors = tuple(
+            (sensor.name, "active" if sensor.is_active else "inactive",
+             canvas_components.get(sensor_id, {}).get('position', (0, 0)))
+            for sensor_id, sensor in engine.get_sensors().items())
+        controllers = tuple(
+            (ctrl.name, ctrl.controller_type, canvas_components.get(ctrl_id, {}).get('position', (0, 0)))
+            for ctrl_id, ctrl in system_view.controllers.items())
+        state = (components, sensors, controllers)
+        
+        if state == last_state:
+            # Nothing moved or changed; skip the Tk work and poll at the idle rate
+            root.after(3000, update_status_display)
+            return
+        last_state = state
         
-        # System components
-        status_text.insert(tk.END, "SYSTEM COMPONENTS:\n")
-        for comp_id, comp in system_view.component_manager.components.items():
-            pos = system_view.canvas_components.get(comp_id, {}).get('position', (0, 0))
-            status_text.insert(tk.END, f"  {comp.name}: {comp.status.value} at {pos}\n")
+        lines = ["SYSTEM COMPONENTS:"]
+        lines.extend(f"  {name}: {status} at {pos}" for name, status, pos in components)
+        lines.extend(("", "SENSORS:"))
+        lines.extend(f"  {name}: {active} at {pos}" for name, active, pos in sensors)
+        if controllers:
+            lines.extend(("", "CONTROLLERS:"))
+            lines.extend(f"  {name}: {ctrl_type} at {pos}" for name, ctrl_type, pos in controllers)
         
-        # Sensors
-        status_text.insert(tk.END, "\nSENSORS:\n")
-        for sensor_id, sensor in engine.get_sensors().items():
-            pos = system_view.canvas_components.get(sensor_id, {}).get('position', (0, 0))
-            active = "active" if sensor.is_active else "inactive"
-            status_text.insert(tk.END, f"  {sensor.name}: {active} at {pos}\n")
+        lines.append("")  # trailing newline without a second string concatenation
         
-        # Controllers
-        if system_view.controllers:
-            status_text.insert(tk.END, "\nCONTROLLERS:\n")
-            for ctrl_id, ctrl in system_view.controllers.items():
-                pos = system_view.canvas_components.get(ctrl_id, {}).get('position', (0, 0))
-                status_text.insert(tk.END, f"  {ctrl.name}: {ctrl.controller_type} at {pos}\n")
+        # Swap the whole Text contents in a single Tcl call
+        status_text.replace(1.0, tk.END, "\n".join(lines))
         
-        root.after(3000, update_status_display)  # Update every 3 seconds
+        # Something changed (e.g. a drag in progress): check again sooner
+        root.after(500, update_status_display)
     
     # Start status updates
     update_status_display()
@@ -210,7 +222,7 @@ def test_enhanced_drag_functionality():
     print("   • Check status updates in the bottom panel")
     
     # Start the GUI
-    root.mainloop()
+    run_gui(root)
 
 if __name__ == "__main__":
     print("Enhanced System View Drag & Drop Test")
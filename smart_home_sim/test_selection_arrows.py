@@ -6,6 +6,7 @@ Test script for selection rectangle movement and arrow clearing fixes.
 import sys
 import os
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
 
 # Add the src directory to the path
@@ -13,8 +14,32 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from gui.system_view import SystemView
 from simulation.engine import SimulationEngine
+from src.sensors.common_sensors import TemperatureSensor, MotionSensor
 import logging
 
+# Instructions shown above the test controls
+_INSTRUCTIONS = """
+    🔍 TESTING FIXES FOR:
+    
+    1. SELECTION RECTANGLE MOVEMENT:
+       • Click on a component to select it (red rectangle appears)
+       • Drag the selected component around
+       • ✅ RED SELECTION RECTANGLE should MOVE with the component
+    
+    2. ARROW TRACKING:
+       • Observe the arrows between components
+       • Start dragging any component
+       • ✅ ARROWS touching the component should FOLLOW it in real-time during drag
+       • ✅ No duplicate arrows should remain after the drag ends
+    
+    3. TEST STEPS:
+       • Click API Server (should show red selection rectangle)
+       • Drag API Server (rectangle and its arrows should move with it)
+       • Click Database (selection should move to database)
+       • Drag Database (test selection movement again)
+       • Try sensors too
+    """
+
 def test_selection_and_arrows():
     """Test selection rectangle movement and arrow clearing."""
     print("Testing Selection Rectangle Movement and Arrow Clearing...")
@@ -24,19 +49,31 @@ def test_selection_and_arrows():
     root.title("Selection & Arrow Test")
     root.geometry("1400x900")
     
+    # Callback output is queued and written to stdout in one go once Tk is idle
+    messages = deque(maxlen=256)
+    
+    def flush_messages():
+        sys.stdout.write("\n".join(messages) + "\n")
+        sys.stdout.flush()
+        messages.clear()
+    
+    def report(message):
+        if not messages:
+            root.after_idle(flush_messages)
+        messages.append(message)
+    
     # Set up logging
-    logging.basicConfig(level=logging.DEBUG)
+    # Pass --debug for DEBUG output; INFO keeps logging off the drag path
+    logging.basicConfig(level=logging.DEBUG if '--debug' in sys.argv else logging.INFO)
     logger = logging.getLogger(__name__)
     
     # Create simulation engine
     engine = SimulationEngine()
     
     # Add some test sensors
-    from src.sensors.temperature_sensor import TemperatureSensor
-    from src.sensors.motion_sensor import MotionSensor
     
-    temp_sensor = TemperatureSensor("temp_test", "Test Temperature")
-    motion_sensor = MotionSensor("motion_test", "Test Motion")
+    temp_sensor = TemperatureSensor(sensor_id="temp_test", name="Test Temperature")
+    motion_sensor = MotionSensor(sensor_id="motion_test", name="Test Motion")
     
     engine.add_sensor(temp_sensor)
     engine.add_sensor(motion_sensor)
@@ -49,73 +86,39 @@ def test_selection_and_arrows():
     info_frame = ttk.LabelFrame(root, text="Selection & Arrow Test Instructions", padding="10")
     info_frame.pack(fill=tk.X, padx=10, pady=5)
     
-    instructions = """
-    🔍 TESTING FIXES FOR:
-    
-    1. SELECTION RECTANGLE MOVEMENT:
-       • Click on a component to select it (red rectangle appears)
-       • Drag the selected component around
-       • ✅ RED SELECTION RECTANGLE should MOVE with the component
-    
-    2. ARROW CLEARING:
-       • Observe the arrows between components
-       • Start dragging any component
-       • ✅ ALL ARROWS should DISAPPEAR immediately when drag starts
-       • ✅ NEW ARROWS should appear in real-time during drag
-    
-    3. TEST STEPS:
-       • Click API Server (should show red selection rectangle)
-       • Drag API Server (rectangle should move with it, arrows should clear/redraw)
-       • Click Database (selection should move to database)
-       • Drag Database (test selection movement again)
-       • Try sensors too
-    """
-    
-    info_label = ttk.Label(info_frame, text=instructions, justify=tk.LEFT, font=('Arial', 9))
+    info_label = ttk.Label(info_frame, text=_INSTRUCTIONS, justify=tk.LEFT, font=('Arial', 9))
     info_label.pack(anchor=tk.W)
     
-    # Create test control panel
+    # Create test control panel; it is packed once all its rows exist
     control_frame = ttk.LabelFrame(root, text="Test Controls", padding="10")
-    control_frame.pack(fill=tk.X, padx=10, pady=5)
     
     def select_api_server():
         system_view.select_component('api_server')
-        print("✓ Selected API Server - check if red rectangle appears")
+        report("✓ Selected API Server - check if red rectangle appears")
     
     def select_database():
         system_view.select_component('database')
-        print("✓ Selected Database - check if selection moves")
+        report("✓ Selected Database - check if selection moves")
     
     def select_temp_sensor():
         system_view.select_component('temp_test')
-        print("✓ Selected Temperature Sensor - check selection")
+        report("✓ Selected Temperature Sensor - check selection")
     
     def clear_selection():
-        system_view.selected_component = None
-        system_view.canvas.delete("selection")
-        system_view.selected_component_label.config(text="No component selected")
-        print("✓ Cleared selection")
+        system_view.clear_selection()
+        report("✓ Cleared selection")
     
     def refresh_all():
         system_view.refresh_diagram()
-        print("✓ Refreshed diagram")
+        update_status()
+        report("✓ Refreshed diagram")
     
     def count_canvas_items():
         all_items = system_view.canvas.find_all()
-        connection_items = []
-        selection_items = []
-        
-        for item in all_items:
-            tags = system_view.canvas.gettags(item)
-            for tag in tags:
-                if 'connection' in tag.lower():
-                    connection_items.append(item)
-                    break
-                elif tag == 'selection':
-                    selection_items.append(item)
-                    break
+        connection_items = system_view.canvas.find_withtag("connection")
+        selection_items = system_view.canvas.find_withtag("selection")
         
-        print(f"📊 Canvas Items: {len(all_items)} total, {len(connection_items)} connections, {len(selection_items)} selection")
+        report(f"📊 Canvas Items: {len(all_items)} total, {len(connection_items)} connections, {len(selection_items)} selection")
     
     # Row 1: Selection tests
     select_row = ttk.Frame(control_frame)
@@ -134,17 +137,23 @@ def test_selection_and_arrows():
     
     def force_clear_arrows():
         system_view.clear_all_connections()
-        print("✓ Force cleared all arrows")
+        report("✓ Force cleared all arrows")
     
     def force_redraw_arrows():
-        system_view.draw_connections()
-        system_view.draw_system_connections()
-        print("✓ Force redrawn all arrows")
+        system_view.redraw_connections()
+        report("✓ Force redrawn all arrows")
+    
+    def highlight_arrows():
+        system_view.style_connections(fill='orange')
+        system_view.style_selection(outline='orange')
+        report("✓ Highlighted all arrows and the selection (Redraw Arrows restores the arrow colors)")
     
     ttk.Button(arrow_row, text="Clear All Arrows", command=force_clear_arrows).pack(side=tk.LEFT, padx=5)
     ttk.Button(arrow_row, text="Redraw Arrows", command=force_redraw_arrows).pack(side=tk.LEFT, padx=5)
+    ttk.Button(arrow_row, text="Highlight Arrows", command=highlight_arrows).pack(side=tk.LEFT, padx=5)
     ttk.Button(arrow_row, text="Refresh All", command=refresh_all).pack(side=tk.LEFT, padx=5)
     ttk.Button(arrow_row, text="Count Items", command=count_canvas_items).pack(side=tk.LEFT, padx=5)
+    control_frame.pack(fill=tk.X, padx=10, pady=5)
     
     # Status display
     status_frame = ttk.LabelFrame(root, text="Test Status", padding="10")
@@ -164,23 +173,24 @@ def test_selection_and_arrows():
         else:
             status_text = "No component selected"
         
-        # Count canvas items
+        # Count canvas items (only runs on selection changes and drag ends)
         all_items = system_view.canvas.find_all()
         selection_items = system_view.canvas.find_withtag("selection")
         
         status_text += f" | Canvas items: {len(all_items)} | Selection items: {len(selection_items)}"
         
         status_label.config(text=status_text)
-        root.after(1000, update_status)  # Update every second
     
-    # Start status updates
+    # Refresh the status only when the selection changes or a drag ends
+    root.bind_all("<<SelectionChanged>>", lambda e: update_status())
+    root.bind_all("<<DragEnd>>", lambda e: update_status())
     update_status()
     
     print("\n🧪 Selection & Arrow Test Started!")
     print("🎯 Test Goals:")
     print("   1. Selection rectangle should move with dragged components")
-    print("   2. Arrows should clear completely when dragging starts")
-    print("   3. Arrows should redraw properly during drag operations")
+    print("   2. Arrows should follow the dragged component")
+    print("   3. Arrows should be redrawn cleanly when the drag ends")
     print("\n📝 Test Steps:")
     print("   1. Click 'Select API Server' and verify red rectangle appears")
     print("   2. Drag the API Server and watch the selection rectangle")
@@ -6,15 +6,51 @@ Test script for window resizing and click detection fixes.
 import sys
 import os
 import tkinter as tk
+from collections import deque
 from tkinter import ttk
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from gui.system_view import SystemView
 from simulation.engine import SimulationEngine
+from src.sensors.common_sensors import TemperatureSensor, MotionSensor, DoorWindowSensor
 import logging
 
+# Instructions shown above the test controls
+_INSTRUCTIONS = """
+    🔧 TESTING WINDOW RESIZE AND CLICK DETECTION:
+    
+    1. RESIZE WINDOW TESTS:
+       • Resize the window by dragging edges/corners
+       • Try different window sizes (larger and smaller)
+       • Click components after each resize
+       • ✅ Components should remain clickable at all window sizes
+    
+    2. CLICK DETECTION TESTS:
+       • Click on system components (API Server, Database, MQTT Broker)
+       • Click on sensors (Temperature, Motion, Door sensors)
+       • Try clicking at different areas of each component
+       • ✅ Components should be selectable regardless of window size
+    
+    3. COORDINATE SYSTEM TESTS:
+       • Resize window, then drag components
+       • Selection rectangles should appear correctly
+       • Drag operations should work smoothly
+       • ✅ Coordinates should be accurate after resize
+    
+    4. SCROLL TESTS (if applicable):
+       • Try scrolling the canvas if components extend beyond view
+       • Click components in scrolled areas
+       • ✅ Click detection should work in scrolled areas
+    """
+
 def test_window_resize_click_detection():
     """Test window resizing and click detection functionality."""
     print("Testing Window Resize and Click Detection...")
@@ -25,21 +61,32 @@ def test_window_resize_click_detection():
     root.geometry("1200x800")
     root.minsize(800, 600)  # Set minimum size
     
+    # Callback output is queued and written to stdout in one go once Tk is idle
+    messages = deque(maxlen=256)
+    
+    def flush_messages():
+        sys.stdout.write("\n".join(messages) + "\n")
+        sys.stdout.flush()
+        messages.clear()
+    
+    def report(message):
+        if not messages:
+            root.after_idle(flush_messages)
+        messages.append(message)
+    
     # Set up logging
-    logging.basicConfig(level=logging.DEBUG)
+    # Pass --debug for DEBUG output; INFO keeps logging off the drag path
+    logging.basicConfig(level=logging.DEBUG if '--debug' in sys.argv else logging.INFO)
     logger = logging.getLogger(__name__)
     
     # Create simulation engine
     engine = SimulationEngine()
     
     # Add test sensors for more components to click on
-    from src.sensors.temperature_sensor import TemperatureSensor
-    from src.sensors.motion_sensor import MotionSensor
-    from src.sensors.door_window_sensor import DoorWindowSensor
     
-    temp_sensor = TemperatureSensor("temp_resize_test", "Resize Test Temp")
-    motion_sensor = MotionSensor("motion_resize_test", "Resize Test Motion")
-    door_sensor = DoorWindowSensor("door_resize_test", "Resize Test Door")
+    temp_sensor = TemperatureSensor(sensor_id="temp_resize_test", name="Resize Test Temp")
+    motion_sensor = MotionSensor(sensor_id="motion_resize_test", name="Resize Test Motion")
+    door_sensor = DoorWindowSensor(sensor_id="door_resize_test", name="Resize Test Door")
     
     engine.add_sensor(temp_sensor)
     engine.add_sensor(motion_sensor)
@@ -53,57 +100,59 @@ def test_window_resize_click_detection():
     info_frame = ttk.LabelFrame(root, text="Window Resize & Click Detection Test", padding="10")
     info_frame.pack(fill=tk.X, padx=10, pady=5)
     
-    instructions = """
-    🔧 TESTING WINDOW RESIZE AND CLICK DETECTION:
-    
-    1. RESIZE WINDOW TESTS:
-       • Resize the window by dragging edges/corners
-       • Try different window sizes (larger and smaller)
-       • Click components after each resize
-       • ✅ Components should remain clickable at all window sizes
-    
-    2. CLICK DETECTION TESTS:
-       • Click on system components (API Server, Database, MQTT Broker)
-       • Click on sensors (Temperature, Motion, Door sensors)
-       • Try clicking at different areas of each component
-       • ✅ Components should be selectable regardless of window size
-    
-    3. COORDINATE SYSTEM TESTS:
-       • Resize window, then drag components
-       • Selection rectangles should appear correctly
-       • Drag operations should work smoothly
-       • ✅ Coordinates should be accurate after resize
-    
-    4. SCROLL TESTS (if applicable):
-       • Try scrolling the canvas if components extend beyond view
-       • Click components in scrolled areas
-       • ✅ Click detection should work in scrolled areas
-    """
-    
-    info_label = ttk.Label(info_frame, text=instructions, justify=tk.LEFT, font=('Arial', 9))
+    info_label = ttk.Label(info_frame, text=_INSTRUCTIONS, justify=tk.LEFT, font=('Arial', 9))
     info_label.pack(anchor=tk.W)
     
-    # Create test control panel
+    # Create test control panel; it is packed once all its rows exist
     control_frame = ttk.LabelFrame(root, text="Test Controls & Diagnostics", padding="10")
-    control_frame.pack(fill=tk.X, padx=10, pady=5)
     
     # Diagnostic information display
     diag_row1 = ttk.Frame(control_frame)
     diag_row1.pack(fill=tk.X, pady=2)
     
+    # Last known (width, height) of the canvas and window, kept current by <Configure>
+    geometry = {}
+    
+    def canvas_size():
+        return geometry.get('canvas') or (system_view.canvas.winfo_width(), system_view.canvas.winfo_height())
+    
+    def window_size():
+        return geometry.get('window') or (root.winfo_width(), root.winfo_height())
+    
+    def on_canvas_configure(event):
+        geometry['canvas'] = (event.width, event.height)
+    
+    system_view.canvas.bind('<Configure>', on_canvas_configure, add='+')
+    
     def get_canvas_info():
-        canvas_width = system_view.canvas.winfo_width()
-        canvas_height = system_view.canvas.winfo_height()
-        window_width = root.winfo_width()
-        window_height = root.winfo_height()
+        canvas_width, canvas_height = canvas_size()
+        window_width, window_height = window_size()
+        # The scroll region changes on redraws as well as resizes, so it is read live
         scroll_region = system_view.canvas.cget('scrollregion')
         
         info = (f"Canvas: {canvas_width}x{canvas_height} | "
                 f"Window: {window_width}x{window_height} | "
                 f"Scroll: {scroll_region}")
-        print(f"📊 {info}")
+        report(f"📊 {info}")
         diag_label.config(text=info)
     
+    # Pending after() id for the coalesced resize report
+    resize_after_id = None
+    
+    def on_resize_settled():
+        nonlocal resize_after_id
+        resize_after_id = None
+        get_canvas_info()
+        window_width, window_height = window_size()
+        report(f"🪟 Window resized to {window_width}x{window_height}")
+    
+    def schedule_resize_info(delay=50):
+        """Report canvas info once the window stops resizing."""
+        nonlocal resize_after_id
+        if resize_after_id is not None:
+            root.after_cancel(resize_after_id)
+        resize_after_id = root.after(delay, on_resize_settled)
+    
     diag_label = ttk.Label(diag_row1, text="Canvas info will appear here...", font=('Consolas', 8))
     diag_label.pack(side=tk.LEFT)
     
@@ -115,58 +164,79 @@ def test_window_resize_click_detection():
     
     def test_click_at_position(x, y):
         """Test clicking at a specific canvas position."""
-        # Simulate a click event
-        event = type('Event', (), {})()
-        event.x = x
-        event.y = y
-        
         # Convert to canvas coordinates
         canvas_x = system_view.canvas.canvasx(x)
         canvas_y = system_view.canvas.canvasy(y)
         
-        # Find items at this position
-        items = system_view.canvas.find_overlapping(canvas_x-5, canvas_y-5, canvas_x+5, canvas_y+5)
+        report(f"🎯 Click test at screen({x},{y}) -> canvas({canvas_x:.1f},{canvas_y:.1f})")
+        
+        # Grid lookup first; only scan canvas items when no component is hit
+        component_id = system_view.component_at(canvas_x, canvas_y)
+        if component_id:
+            report(f"   Component hit: {component_id}")
+            return
         
-        print(f"🎯 Click test at screen({x},{y}) -> canvas({canvas_x:.1f},{canvas_y:.1f})")
-        print(f"   Found {len(items)} items: {items}")
+        items = system_view.canvas.find_overlapping(canvas_x-5, canvas_y-5, canvas_x+5, canvas_y+5)
+        report(f"   Found {len(items)} items: {items}")
         
         if items:
             for item in items:
                 tags = system_view.canvas.gettags(item)
-                print(f"   Item {item}: tags {tags}")
+                report(f"   Item {item}: tags {tags}")
     
     def test_component_clicks():
         """Test clicking on all components."""
-        print("\n🔍 Testing component clicks after current window size...")
+        report("\n🔍 Testing component clicks after current window size...")
+        
+        # Check every stored position against the click grid's hit boxes in one pass
+        components = system_view.canvas_components
+        comp_ids = list(components)
+        positions = [components[comp_id]['position'] for comp_id in comp_ids]
+        boxes = [components[comp_id]['bbox'] for comp_id in comp_ids]
+        
+        if NUMPY_AVAILABLE and comp_ids:
+            pts = np.array(positions, dtype=float)
+            bb = np.array(boxes, dtype=float)
+            # hits[i, j]: box j overlaps the 20x20 probe square around position i
+            hits = ((bb[None, :, 0] <= pts[:, None, 0] + 10) & (bb[None, :, 2] >= pts[:, None, 0] - 10) &
+                    (bb[None, :, 1] <= pts[:, None, 1] + 10) & (bb[None, :, 3] >= pts[:, None, 1] - 10))
+            found = [[comp_ids[j] for j in np.flatnonzero(row)] for row in hits]
+        else:
+            found = [[comp_id for comp_id, (x1, y1, x2, y2) in zip(comp_ids, boxes)
+                      if x1 <= x + 10 and x2 >= x - 10 and y1 <= y + 10 and y2 >= y - 10]
+                     for x, y in positions]
         
-        for comp_id, comp_info in system_view.canvas_components.items():
-            x, y = comp_info['position']
-            print(f"🎯 Testing {comp_id} at stored position ({x},{y})")
-            
-            # Find actual canvas items at this position
-            items = system_view.canvas.find_overlapping(x-10, y-10, x+10, y+10)
-            print(f"   Items found: {items}")
-            
-            # Test if component is clickable
-            if comp_info['canvas_ids']:
-                first_item = comp_info['canvas_ids'][0]
-                coords = system_view.canvas.coords(first_item)
-                print(f"   First item coords: {coords}")
+        # Verify the survivors against the canvas itself: the stored hit box must still
+        # match what Tk draws, or clicks would miss after a resize or drag
+        canvas_boxes = {}
+        for comp_id, (x, y), box, hits_here in zip(comp_ids, positions, boxes, found):
+            report(f"🎯 Testing {comp_id} at stored position ({x},{y})")
+            report(f"   Components found: {hits_here}")
+            for hit_id in hits_here:
+                if hit_id not in canvas_boxes:
+                    canvas_boxes[hit_id] = system_view.canvas_hit_box(hit_id)
+            actual = canvas_boxes.get(comp_id) or system_view.canvas_hit_box(comp_id)
+            if tuple(actual) == tuple(box):
+                report(f"   Hit box: {box} (matches canvas)")
+            else:
+                report(f"   ✗ Hit box drifted: stored {box}, canvas {actual}")
+            if not (actual[0] <= x <= actual[2] and actual[1] <= y <= actual[3]):
+                report("   ✗ Canvas items no longer cover the stored position")
     
     def resize_window_small():
         root.geometry("900x600")
-        root.after(100, get_canvas_info)
-        print("📏 Resized window to SMALL (900x600)")
+        schedule_resize_info(100)
+        report("📏 Resized window to SMALL (900x600)")
     
     def resize_window_large():
         root.geometry("1600x1000")
-        root.after(100, get_canvas_info)
-        print("📏 Resized window to LARGE (1600x1000)")
+        schedule_resize_info(100)
+        report("📏 Resized window to LARGE (1600x1000)")
     
     def resize_window_medium():
         root.geometry("1200x800")
-        root.after(100, get_canvas_info)
-        print("📏 Resized window to MEDIUM (1200x800)")
+        schedule_resize_info(100)
+        report("📏 Resized window to MEDIUM (1200x800)")
     
     # Test buttons
     ttk.Label(test_row, text="Window Size:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
@@ -179,6 +249,7 @@ def test_window_resize_click_detection():
     ttk.Label(test_row, text="Tests:", font=('Arial', 10, 'bold')).pack(side=tk.LEFT)
     ttk.Button(test_row, text="Test Component Clicks", command=test_component_clicks).pack(side=tk.LEFT, padx=2)
     ttk.Button(test_row, text="Refresh Diagram", command=system_view.refresh_diagram).pack(side=tk.LEFT, padx=2)
+    control_frame.pack(fill=tk.X, padx=10, pady=5)
     
     # Click tracking
     click_info_frame = ttk.LabelFrame(root, text="Click Tracking", padding="5")
@@ -187,36 +258,36 @@ def test_window_resize_click_detection():
     click_info_label = ttk.Label(click_info_frame, text="Click anywhere on canvas to see coordinate info", font=('Consolas', 9))
     click_info_label.pack()
     
-    # Override canvas click to add debugging
-    original_click = system_view.on_canvas_click
-    
+    # Trace canvas clicks through SystemView's click callbacks
     def debug_canvas_click(event):
         canvas_x = system_view.canvas.canvasx(event.x)
         canvas_y = system_view.canvas.canvasy(event.y)
         
-        items = system_view.canvas.find_overlapping(canvas_x-5, canvas_y-5, canvas_x+5, canvas_y+5)
+        # Grid lookup first; only scan canvas items when no component is hit
+        component_id = system_view.component_at(canvas_x, canvas_y)
+        items = () if component_id else system_view.canvas.find_overlapping(
+            canvas_x-5, canvas_y-5, canvas_x+5, canvas_y+5)
+        hit = f"Component: {component_id}" if component_id else f"Items: {len(items)}"
+        window_width, window_height = window_size()
         
         click_info = (f"Click: screen({event.x},{event.y}) -> canvas({canvas_x:.1f},{canvas_y:.1f}) | "
-                     f"Items: {len(items)} | Window: {root.winfo_width()}x{root.winfo_height()}")
+                     f"{hit} | Window: {window_width}x{window_height}")
         
         click_info_label.config(text=click_info)
-        print(f"🖱️ {click_info}")
+        report(f"🖱️ {click_info}")
         
         if items:
             for item in items:
                 tags = system_view.canvas.gettags(item)
-                print(f"   Item {item}: {tags}")
-        
-        # Call original click handler
-        original_click(event)
+                report(f"   Item {item}: {tags}")
     
-    system_view.canvas.bind('<Button-1>', debug_canvas_click)
+    system_view.add_click_callback(debug_canvas_click)
     
     # Window resize tracking
     def on_window_resize(event=None):
         if event and event.widget == root:
-            get_canvas_info()
-            print(f"🪟 Window resized to {root.winfo_width()}x{root.winfo_height()}")
+            geometry['window'] = (event.width, event.height)
+            schedule_resize_info()
     
     root.bind('<Configure>', on_window_resize)
     
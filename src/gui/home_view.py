@@ -6,7 +6,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import math
 import os
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterable, List, Tuple, Optional
 
 try:
     from PIL import Image, ImageTk
@@ -554,15 +554,33 @@ class HomeView:
     
     def add_sensor(self, sensor: BaseSensor):
         """Add a sensor to the home view."""
-        if sensor.sensor_id not in self.sensor_widgets:
-            x, y = sensor.location
-            widget = SensorWidget(self.canvas, sensor, x, y, self)
-            self.sensor_widgets[sensor.sensor_id] = widget
-            
+        widget = self._create_sensor_widget(sensor)
+        if widget:
             # Ensure sensor is drawn above background image
             self.ensure_sensor_on_top(widget)
             
-            self.logger.info(f"Added sensor {sensor.name} to home view at ({x}, {y})")
+            self.logger.info(f"Added sensor {sensor.name} to home view at ({widget.x}, {widget.y})")
+    
+    def add_sensors(self, sensors: Iterable[BaseSensor]) -> int:
+        """Add several sensors with a single summary log entry. Returns the number added."""
+        added = 0
+        for sensor in sensors:
+            if self._create_sensor_widget(sensor):
+                added += 1
+        
+        # Newly created items already sit above the background, so no per-widget raise is needed
+        if added:
+            self.logger.info(f"Added {added} sensors to home view")
+        return added
+    
+    def _create_sensor_widget(self, sensor: BaseSensor) -> Optional['SensorWidget']:
+        """Create and store the widget for a sensor not yet shown; None if it is already present."""
+        if sensor.sensor_id in self.sensor_widgets:
+            return None
+        x, y = sensor.location
+        widget = SensorWidget(self.canvas, sensor, x, y, self)
+        self.sensor_widgets[sensor.sensor_id] = widget
+        return widget
     
     def ensure_sensors_on_top(self):
         """Ensure all sensor widgets are drawn above the background image."""
@@ -785,11 +803,9 @@ class HomeView:
                 self.logger.error(f"Error checking image state: {e}")
         
         # Add template sensors
-        for sensor_data in template_data.get('sensors', []):
-            # This would create sensor instances from template
-            sensor = self.sim_engine.create_sensor(sensor_data)
-            if sensor:
-                self.add_sensor(sensor)
+        # This would create sensor instances from template
+        sensors = (self.sim_engine.create_sensor(sensor_data) for sensor_data in template_data.get('sensors', []))
+        self.add_sensors(sensor for sensor in sensors if sensor)
     
     def refresh(self):
         """Refresh the view with current simulation state."""
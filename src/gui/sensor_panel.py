@@ -4,11 +4,72 @@ Sensor panel for managing sensors in the simulation.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
+from tkinter import font as tkfont
 from typing import Dict, Any, Optional
 
 from src.sensors.base_sensor import BaseSensor
 from src.sensors.common_sensors import sensor_registry
 
+# Height in pixels of one row in the sensor config list
+_CONFIG_ROW_HEIGHT = 26
+
+# Tk variable used to edit a config value of each type (anything else is a string)
+_CONFIG_VARIABLES = {
+    bool: tk.BooleanVar,
+    int: tk.DoubleVar,
+    float: tk.DoubleVar,
+    str: tk.StringVar
+}
+
+# Converts an edited value back to the type of the config default
+_CONFIG_CONVERTERS = {
+    int: lambda value: int(float(value)),
+    float: float,
+    bool: bool
+}
+
+
+def _keep_value(value):
+    """Leave values whose default type has no converter unchanged."""
+    return value
+
+
+# Memoized str.title() of sensor type and status names (only a handful exist)
+_TITLES: Dict[str, str] = {}
+
+
+def _title(text: str) -> str:
+    """Title-case text and remember the result in _TITLES."""
+    title = _TITLES[text] = text.title()
+    return title
+
+
+# Sensor tree columns and their widths
+_TREE_COLUMNS = (("Name", 100), ("Type", 80), ("Status", 60), ("Location", 80))
+
+# Config lists longer than this get a scrolling canvas
+_MAX_UNSCROLLED_CONFIG_ROWS = 8
+
+# Sensor types are registered at import time and don't change afterwards
+_AVAILABLE_TYPES = tuple(sensor_registry.get_available_types().keys())
+
+_TYPE_DESCRIPTIONS = {
+    'temperature': 'Temperature and thermal monitoring',
+    'motion': 'PIR motion detection',
+    'door_window': 'Door and window open/close detection',
+    'smoke': 'Smoke and fire detection',
+    'light': 'Ambient light level monitoring',
+    'humidity': 'Humidity and moisture monitoring',
+    'pressure': 'Atmospheric pressure monitoring',
+    'proximity': 'Ultrasonic distance measurement'
+}
+
+# Dropdown entries in AddSensorDialog, in _AVAILABLE_TYPES order
+_TYPE_LABELS = tuple(
+    f"{sensor_type.title()}: {_TYPE_DESCRIPTIONS.get(sensor_type, 'Sensor')}"
+    for sensor_type in _AVAILABLE_TYPES
+)
+
 
 class SensorConfigDialog:
     """Dialog for configuring sensor parameters."""
@@ -24,15 +85,14 @@ class SensorConfigDialog:
         """Create the configuration dialog."""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title(f"Configure {self.sensor.name}")
-        self.dialog.geometry("400x500")
         self.dialog.transient(self.parent)
         self.dialog.grab_set()
         
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
+        # Center dialog (size is fixed, so no need to flush idle tasks first)
+        width, height = 400, 500
+        x = (self.dialog.winfo_screenwidth() - width) // 2
+        y = (self.dialog.winfo_screenheight() - height) // 2
+        self.dialog.geometry(f"{width}x{height}+{x}+{y}")
         
         self.create_widgets()
     
@@ -73,25 +133,15 @@ class SensorConfigDialog:
         config_frame = ttk.LabelFrame(main_frame, text="Configuration Parameters", padding="5")
         config_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 10))
         
-        # Create scrollable frame for config parameters
-        canvas = tk.Canvas(config_frame, height=200)
-        scrollbar = ttk.Scrollbar(config_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = ttk.Frame(canvas)
-        
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-        
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-        
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-        
-        # Create config parameter widgets
+        # Create config parameter variables
         self.config_vars = {}
-        self.create_config_widgets(scrollable_frame)
+        self.create_config_vars()
+        
+        if len(self.config_vars) <= _MAX_UNSCROLLED_CONFIG_ROWS:
+            # Few enough rows to fit without a scrolling canvas
+            self.create_config_widgets(config_frame)
+        else:
+            self.create_config_list(config_frame)
         
         # Security frame
         security_frame = ttk.LabelFrame(main_frame, text="Security Settings", padding="5")
@@ -112,32 +162,115 @@ class SensorConfigDialog:
         ttk.Button(buttons_frame, text="Cancel", command=self.cancel_clicked).pack(side=tk.RIGHT)
         ttk.Button(buttons_frame, text="Reset to Defaults", command=self.reset_defaults).pack(side=tk.LEFT)
     
-    def create_config_widgets(self, parent):
-        """Create widgets for configuration parameters."""
-        config = {**self.sensor.get_default_config(), **self.sensor.config}
+    def create_config_vars(self):
+        """Create variables holding the configuration parameter values."""
+        # get_default_config() returns a fresh dict, so merge into it in place
+        config = self.sensor.get_default_config()
+        
+        # Pick each key's converter from its default type (before the current
+        # values are merged in) so ok_clicked is a lookup per key
+        self._converters = {
+            key: _CONFIG_CONVERTERS.get(type(value), _keep_value)
+            for key, value in config.items()
+        }
+        
+        config.update(self.sensor.config)
         
-        row = 0
         for key, value in config.items():
+            var_class = _CONFIG_VARIABLES.get(type(value), tk.StringVar)
+            if var_class is tk.StringVar:
+                value = str(value)
+            
+            self.config_vars[key] = var_class(value=value)
+    
+    def create_config_widgets(self, parent):
+        """Grid a label and value widget for every configuration parameter."""
+        for row, (key, var) in enumerate(self.config_vars.items()):
             ttk.Label(parent, text=f"{key}:").grid(row=row, column=0, sticky="w", padx=(0, 5))
             
-            if isinstance(value, bool):
-                var = tk.BooleanVar(value=value)
+            if isinstance(var, tk.BooleanVar):
                 ttk.Checkbutton(parent, variable=var).grid(row=row, column=1, sticky="w")
-            elif isinstance(value, (int, float)):
-                var = tk.DoubleVar(value=float(value))
-                entry = ttk.Entry(parent, textvariable=var, width=15)
-                entry.grid(row=row, column=1, sticky="w")
-            elif isinstance(value, str):
-                var = tk.StringVar(value=value)
-                entry = ttk.Entry(parent, textvariable=var, width=20)
-                entry.grid(row=row, column=1, sticky="w")
             else:
-                var = tk.StringVar(value=str(value))
-                entry = ttk.Entry(parent, textvariable=var, width=20)
-                entry.grid(row=row, column=1, sticky="w")
+                width = 15 if isinstance(var, tk.DoubleVar) else 20
+                ttk.Entry(parent, textvariable=var, width=width).grid(row=row, column=1, sticky="w")
+    
+    def create_config_list(self, parent):
+        """Create a scrolling config list that only has widgets for the rows in view."""
+        # Rows are laid out on a canvas and recycled as the list scrolls
+        self.config_canvas = tk.Canvas(parent, height=200, highlightthickness=0,
+                                       yscrollincrement=_CONFIG_ROW_HEIGHT)
+        scrollbar = ttk.Scrollbar(parent, orient="vertical", command=self.on_config_scroll)
+        self.config_canvas.configure(yscrollcommand=scrollbar.set)
+        self.config_canvas.bind("<Configure>", lambda e: self.layout_config_rows())
+        
+        self.config_canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        self._config_keys = list(self.config_vars)
+        self._config_rows = []
+        
+        # Values start right after the widest key label
+        label_font = tkfont.nametofont("TkDefaultFont")
+        self._config_value_x = max(label_font.measure(f"{key}:") for key in self._config_keys) + 5
+        
+        self.config_canvas.configure(
+            scrollregion=(0, 0, 0, len(self._config_keys) * _CONFIG_ROW_HEIGHT))
+        self.layout_config_rows()
+    
+    def create_config_row(self):
+        """Create a reusable row of config widgets on the canvas."""
+        canvas = self.config_canvas
+        label = ttk.Label(canvas)
+        return {
+            'key': None,
+            'label': label,
+            'entry': ttk.Entry(canvas),
+            'check': ttk.Checkbutton(canvas),
+            'label_item': canvas.create_window(0, 0, window=label, anchor="nw"),
+            'value_item': canvas.create_window(self._config_value_x, 0, anchor="nw")
+        }
+    
+    def layout_config_rows(self):
+        """Attach pooled row widgets to the config keys currently in view."""
+        canvas = self.config_canvas
+        keys = self._config_keys
+        
+        # Grow the pool to cover the viewport, plus one partially shown row
+        height = max(canvas.winfo_height(), canvas.winfo_reqheight())
+        needed = min(len(keys), height // _CONFIG_ROW_HEIGHT + 2)
+        while len(self._config_rows) < needed:
+            self._config_rows.append(self.create_config_row())
+        
+        first = int(canvas.canvasy(0)) // _CONFIG_ROW_HEIGHT
+        first = max(0, min(first, len(keys) - len(self._config_rows)))
+        
+        for offset, row in enumerate(self._config_rows):
+            index = first + offset
+            key = keys[index]
             
-            self.config_vars[key] = var
-            row += 1
+            if row['key'] != key:
+                var = self.config_vars[key]
+                row['label'].configure(text=f"{key}:")
+                
+                if isinstance(var, tk.BooleanVar):
+                    row['check'].configure(variable=var)
+                    widget = row['check']
+                else:
+                    width = 15 if isinstance(var, tk.DoubleVar) else 20
+                    row['entry'].configure(textvariable=var, width=width)
+                    widget = row['entry']
+                
+                canvas.itemconfigure(row['value_item'], window=widget)
+                row['key'] = key
+            
+            y = index * _CONFIG_ROW_HEIGHT
+            canvas.coords(row['label_item'], 0, y)
+            canvas.coords(row['value_item'], self._config_value_x, y)
+    
+    def on_config_scroll(self, *args):
+        """Scroll the config list and rebind rows to the new viewport."""
+        self.config_canvas.yview(*args)
+        self.layout_config_rows()
     
     def reset_defaults(self):
         """Reset configuration to defaults."""
@@ -154,21 +287,10 @@ class SensorConfigDialog:
     def ok_clicked(self):
         """Handle OK button click."""
         try:
-            # Collect configuration values
-            config = {}
-            for key, var in self.config_vars.items():
-                value = var.get()
-                
-                # Try to convert to appropriate type
-                original_type = type(self.sensor.get_default_config().get(key, ""))
-                if original_type == int:
-                    value = int(float(value))
-                elif original_type == float:
-                    value = float(value)
-                elif original_type == bool:
-                    value = bool(value)
-                
-                config[key] = value
+            # Collect configuration values, converted back to their default types
+            converters = self._converters
+            config = {key: converters.get(key, _keep_value)(var.get())
+                      for key, var in self.config_vars.items()}
             
             # Create result
             self.result = {
@@ -197,9 +319,11 @@ class SensorConfigDialog:
 class AddSensorDialog:
     """Dialog for adding a new sensor."""
     
-    def __init__(self, parent):
+    def __init__(self, parent, modal: bool = True):
         self.parent = parent
+        self.modal = modal
         self.result = None
+        self.result_callback = None
         
         self.create_dialog()
     
@@ -207,15 +331,15 @@ class AddSensorDialog:
         """Create the add sensor dialog."""
         self.dialog = tk.Toplevel(self.parent)
         self.dialog.title("Add New Sensor")
-        self.dialog.geometry("350x400")
         self.dialog.transient(self.parent)
-        self.dialog.grab_set()
+        if self.modal:
+            self.dialog.grab_set()
         
-        # Center dialog
-        self.dialog.update_idletasks()
-        x = (self.dialog.winfo_screenwidth() // 2) - (self.dialog.winfo_width() // 2)
-        y = (self.dialog.winfo_screenheight() // 2) - (self.dialog.winfo_height() // 2)
-        self.dialog.geometry(f"+{x}+{y}")
+        # Center dialog (size is fixed, so no need to flush idle tasks first)
+        width, height = 350, 400
+        x = (self.dialog.winfo_screenwidth() - width) // 2
+        y = (self.dialog.winfo_screenheight() - height) // 2
+        self.dialog.geometry(f"{width}x{height}+{x}+{y}")
         
         self.create_widgets()
     
@@ -228,36 +352,17 @@ class AddSensorDialog:
         type_frame = ttk.LabelFrame(main_frame, text="Sensor Type", padding="5")
         type_frame.pack(fill=tk.X, pady=(0, 10))
         
-        # Get available sensor types
-        available_types = list(sensor_registry.get_available_types().keys())
-        
         self.sensor_type_var = tk.StringVar()
         
-        # Create radio buttons for each sensor type
-        self.type_descriptions = {
-            'temperature': 'Temperature and thermal monitoring',
-            'motion': 'PIR motion detection',
-            'door_window': 'Door and window open/close detection',
-            'smoke': 'Smoke and fire detection',
-            'light': 'Ambient light level monitoring',
-            'humidity': 'Humidity and moisture monitoring',
-            'pressure': 'Atmospheric pressure monitoring',
-            'proximity': 'Ultrasonic distance measurement'
-        }
-        
-        for i, sensor_type in enumerate(available_types):
-            rb = ttk.Radiobutton(
-                type_frame, 
-                text=f"{sensor_type.title()}: {self.type_descriptions.get(sensor_type, 'Sensor')}",
-                variable=self.sensor_type_var,
-                value=sensor_type,
-                command=self.on_type_changed
-            )
-            rb.pack(anchor=tk.W, pady=2)
+        # A single dropdown rather than a radio button per sensor type
+        self.type_combo = ttk.Combobox(type_frame, values=_TYPE_LABELS, state="readonly")
+        self.type_combo.pack(fill=tk.X, pady=2)
+        self.type_combo.bind('<<ComboboxSelected>>', self.on_type_selected)
         
         # Set default selection
-        if available_types:
-            self.sensor_type_var.set(available_types[0])
+        if _AVAILABLE_TYPES:
+            self.type_combo.current(0)
+            self.sensor_type_var.set(_AVAILABLE_TYPES[0])
         
         # Basic configuration
         config_frame = ttk.LabelFrame(main_frame, text="Basic Configuration", padding="5")
@@ -293,10 +398,15 @@ class AddSensorDialog:
         # Update name when type changes
         self.on_type_changed()
     
+    def on_type_selected(self, event):
+        """Handle a sensor type being picked from the dropdown."""
+        self.sensor_type_var.set(_AVAILABLE_TYPES[self.type_combo.current()])
+        self.on_type_changed()
+    
     def on_type_changed(self):
         """Handle sensor type change."""
         sensor_type = self.sensor_type_var.get()
-        if not self.name_var.get() or self.name_var.get().startswith(tuple(self.type_descriptions.keys())):
+        if not self.name_var.get() or self.name_var.get().startswith(_AVAILABLE_TYPES):
             # Auto-generate name
             self.name_var.set(f"{sensor_type}_sensor")
     
@@ -330,6 +440,17 @@ class AddSensorDialog:
         """Get dialog result."""
         self.dialog.wait_window()
         return self.result
+    
+    def open_async(self, callback):
+        """Return immediately and pass the result to callback when the dialog closes."""
+        self.result_callback = callback
+        self.dialog.bind('<Destroy>', self.on_destroy, add='+')
+    
+    def on_destroy(self, event):
+        """Handle dialog destruction."""
+        # Child widgets report <Destroy> through the toplevel binding too
+        if event.widget is self.dialog and self.result_callback:
+            self.result_callback(self.result)
 
 
 class SensorPanel:
@@ -341,6 +462,24 @@ class SensorPanel:
         self.logger = logger
         self.selection_callback = None  # Callback for selection changes
         
+        # sensor_id -> values tuple last written to the tree
+        self._row_cache: Dict[str, tuple] = {}
+        self._last_signature = None
+        
+        # Coalesce sensor_data refreshes (at most 10 per second)
+        self._refresh_pending = False
+        self._min_refresh_ms = 100
+        
+        # Set when a refresh was skipped because the panel was hidden
+        self._dirty = False
+        
+        # The open add sensor dialog, if any (only one at a time)
+        self._add_dialog = None
+        
+        # Filter values (the filter widgets themselves are built on demand)
+        self.type_filter_var = tk.StringVar(value="All")
+        self.status_filter_var = tk.StringVar(value="All")
+        
         self.setup_ui()
         self.refresh()
     
@@ -358,25 +497,20 @@ class SensorPanel:
         ttk.Button(toolbar, text="Configure", command=self.configure_selected_sensor).pack(side=tk.LEFT)
         
         ttk.Button(toolbar, text="Refresh", command=self.refresh).pack(side=tk.RIGHT)
+        ttk.Button(toolbar, text="Filters", command=self.show_filters).pack(side=tk.RIGHT, padx=(0, 5))
         
         # Sensor list
         list_frame = ttk.Frame(self.frame)
         list_frame.pack(fill=tk.BOTH, expand=True)
         
         # Treeview for sensor list
-        columns = ("Name", "Type", "Status", "Location")
+        columns = tuple(name for name, _ in _TREE_COLUMNS)
         self.tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=10)
         
         # Configure columns
-        self.tree.heading("Name", text="Name")
-        self.tree.heading("Type", text="Type")
-        self.tree.heading("Status", text="Status")
-        self.tree.heading("Location", text="Location")
-        
-        self.tree.column("Name", width=100)
-        self.tree.column("Type", width=80)
-        self.tree.column("Status", width=60)
-        self.tree.column("Location", width=80)
+        for name, width in _TREE_COLUMNS:
+            self.tree.heading(name, text=name)
+            self.tree.column(name, width=width)
         
         # Scrollbar
         scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
@@ -389,6 +523,7 @@ class SensorPanel:
         self.tree.bind('<Double-1>', self.on_double_click)
         self.tree.bind('<Button-3>', self.on_right_click)
         self.tree.bind('<<TreeviewSelect>>', self.on_selection_changed)
+        self.frame.bind('<Map>', self.on_map)
         
         # Context menu
         self.context_menu = tk.Menu(self.frame, tearoff=0)
@@ -405,19 +540,25 @@ class SensorPanel:
         self.status_label = ttk.Label(status_frame, text="0 sensors")
         self.status_label.pack(side=tk.LEFT)
         
-        # Filter frame (collapsed by default)
-        self.filter_frame = ttk.LabelFrame(self.frame, text="Filters")
-        # Don't pack initially - can be shown/hidden
-        
-        self.setup_filters()
+        # Filter frame (collapsed by default, built the first time it is shown)
+        self.filter_frame = None
+        self._filters_built = False
+    
+    def show_filters(self):
+        """Show the filter controls, building them on first use."""
+        if not self._filters_built:
+            self.filter_frame = ttk.LabelFrame(self.frame, text="Filters")
+            self.setup_filters()
+            self._filters_built = True
+        
+        self.filter_frame.pack(fill=tk.X, pady=(5, 0))
     
     def setup_filters(self):
         """Setup filter controls."""
         # Type filter
         ttk.Label(self.filter_frame, text="Type:").grid(row=0, column=0, sticky="w", padx=(0, 5))
-        self.type_filter_var = tk.StringVar(value="All")
         
-        type_values = ["All"] + list(sensor_registry.get_available_types().keys())
+        type_values = ("All",) + _AVAILABLE_TYPES
         type_combo = ttk.Combobox(self.filter_frame, textvariable=self.type_filter_var,
                                  values=type_values, state="readonly", width=12)
         type_combo.grid(row=0, column=1, padx=(0, 10))
@@ -425,7 +566,6 @@ class SensorPanel:
         
         # Status filter
         ttk.Label(self.filter_frame, text="Status:").grid(row=0, column=2, sticky="w", padx=(0, 5))
-        self.status_filter_var = tk.StringVar(value="All")
         
         status_values = ["All", "Active", "Inactive", "Error", "Maintenance"]
         status_combo = ttk.Combobox(self.filter_frame, textvariable=self.status_filter_var,
@@ -435,9 +575,20 @@ class SensorPanel:
     
     def show_add_sensor_dialog(self):
         """Show dialog to add a new sensor."""
-        dialog = AddSensorDialog(self.frame)
-        result = dialog.get_result()
+        # Without a grab nothing blocks the button, so raise the open dialog
+        # instead of stacking a second one that would add another sensor
+        if self._add_dialog is not None:
+            self._add_dialog.dialog.lift()
+            self._add_dialog.dialog.focus_set()
+            return
         
+        # Non-modal so the main loop keeps servicing simulation events
+        self._add_dialog = AddSensorDialog(self.frame, modal=False)
+        self._add_dialog.open_async(self.on_add_sensor_result)
+    
+    def on_add_sensor_result(self, result):
+        """Create the sensor requested through the add sensor dialog."""
+        self._add_dialog = None
         if result:
             try:
                 # Create sensor
@@ -465,8 +616,7 @@ class SensorPanel:
             messagebox.showwarning("Warning", "Please select a sensor to configure.")
             return
         
-        item = selection[0]
-        sensor_id = self.tree.item(item)['values'][0]  # Assuming first column has ID
+        sensor_id = selection[0]  # Item IDs are sensor IDs
         sensor = self.sim_engine.get_sensor(sensor_id)
         
         if sensor:
@@ -477,7 +627,7 @@ class SensorPanel:
                 # Apply configuration
                 sensor.name = result['name']
                 sensor.set_location(result['location'][0], result['location'][1])
-                sensor.config.update(result['config'])
+                sensor.update_config(result['config'])
                 sensor.security_level = result['security_level']
                 
                 self.refresh()
@@ -491,8 +641,7 @@ class SensorPanel:
             return
         
         if messagebox.askyesno("Confirm", "Are you sure you want to remove the selected sensor(s)?"):
-            for item in selection:
-                sensor_id = self.tree.item(item)['values'][0]
+            for sensor_id in selection:
                 self.sim_engine.remove_sensor(sensor_id)
                 self.logger.info(f"Removed sensor: {sensor_id}")
             
@@ -502,8 +651,7 @@ class SensorPanel:
         """Activate the selected sensor."""
         selection = self.tree.selection()
         if selection:
-            for item in selection:
-                sensor_id = self.tree.item(item)['values'][0]
+            for sensor_id in selection:
                 sensor = self.sim_engine.get_sensor(sensor_id)
                 if sensor:
                     sensor.activate()
@@ -513,58 +661,97 @@ class SensorPanel:
         """Deactivate the selected sensor."""
         selection = self.tree.selection()
         if selection:
-            for item in selection:
-                sensor_id = self.tree.item(item)['values'][0]
+            for sensor_id in selection:
                 sensor = self.sim_engine.get_sensor(sensor_id)
                 if sensor:
                     sensor.deactivate()
             self.refresh()
     
     def refresh(self):
-        """Refresh the sensor list."""
-        # Clear current items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Refresh the sensor list, touching only rows whose values changed."""
+        # Defer the work until the panel is shown again
+        if not self.frame.winfo_ismapped():
+            self._dirty = True
+            return
+        self._dirty = False
         
         # Get sensors from simulation engine
         sensors = self.sim_engine.get_sensors()
         
         # Apply filters
-        type_filter = self.type_filter_var.get() if hasattr(self, 'type_filter_var') else "All"
-        status_filter = self.status_filter_var.get() if hasattr(self, 'status_filter_var') else "All"
+        type_filter = self.type_filter_var.get()
+        status_filter = self.status_filter_var.get()
         
-        filtered_sensors = []
-        for sensor in sensors.values():
+        # Read everything the tree shows in one pass over the sensors
+        snapshot = tuple(
+            (sensor.sensor_id, sensor.name, sensor.get_sensor_type(), sensor.status.value, sensor.location)
+            for sensor in sensors.values()
+        )
+        
+        # Nothing shown in the tree changed (typically just new sensor readings)
+        signature = (type_filter, status_filter, snapshot)
+        if signature == self._last_signature:
+            return
+        self._last_signature = signature
+        
+        row_cache = self._row_cache
+        titles = _TITLES
+        seen = set()
+        new_rows = []
+        for sensor_id, name, sensor_type, status, location in snapshot:
+            type_title = titles.get(sensor_type) or _title(sensor_type)
+            status_title = titles.get(status) or _title(status)
+            
             # Type filter
-            if type_filter != "All" and sensor.get_sensor_type() != type_filter:
+            if type_filter != "All" and sensor_type != type_filter:
                 continue
             
             # Status filter
-            if status_filter != "All" and sensor.status.value.title() != status_filter:
+            if status_filter != "All" and status_title != status_filter:
                 continue
             
-            filtered_sensors.append(sensor)
-        
-        # Populate tree
-        for sensor in filtered_sensors:
-            location_str = f"({sensor.location[0]}, {sensor.location[1]})"
+            # Position among the visible rows, in snapshot order
+            index = len(seen)
+            seen.add(sensor_id)
+            values = (name, type_title, status_title, f"({location[0]}, {location[1]})")
             
-            self.tree.insert("", tk.END, values=(
-                sensor.sensor_id,  # Hidden ID for reference
-                sensor.name,
-                sensor.get_sensor_type().title(),
-                sensor.status.value.title(),
-                location_str
-            ))
+            # The sensor ID doubles as the tree item ID
+            cached = row_cache.get(sensor_id)
+            if cached is None:
+                new_rows.append((index, sensor_id, values))
+            elif cached != values:
+                self.tree.item(sensor_id, values=values)
+            row_cache[sensor_id] = values
+        
+        # Drop rows for sensors that were removed or filtered out
+        for sensor_id in row_cache.keys() - seen:
+            self.tree.delete(sensor_id)
+            del row_cache[sensor_id]
+        
+        # Insert new rows with raw Tcl calls, skipping Treeview.insert's
+        # option formatting (this dominates the first populate). Rows are
+        # inserted in ascending index order, so every row before each one is
+        # already in place and the tree keeps snapshot order across filter
+        # changes.
+        if new_rows:
+            call = self.tree.tk.call
+            tree_path = str(self.tree)
+            for index, sensor_id, values in new_rows:
+                call(tree_path, 'insert', '', index, '-id', sensor_id, '-values', values)
         
         # Update status
-        count = len(filtered_sensors)
+        count = len(seen)
         total = len(sensors)
         if count == total:
             self.status_label.config(text=f"{count} sensors")
         else:
             self.status_label.config(text=f"{count} of {total} sensors")
     
+    def on_map(self, event):
+        """Catch up on refreshes skipped while the panel was hidden."""
+        if self._dirty:
+            self.refresh()
+    
     def on_double_click(self, event):
         """Handle double-click on sensor item."""
         self.configure_selected_sensor()
@@ -581,10 +768,8 @@ class SensorPanel:
         """Handle tree view selection change."""
         selection = self.tree.selection()
         if selection and self.selection_callback:
-            # Get sensor ID from the selected item
-            item = selection[0]
-            sensor_id = self.tree.item(item)['values'][0]  # Assuming first column has ID
-            self.selection_callback(sensor_id)
+            # Item IDs are sensor IDs
+            self.selection_callback(selection[0])
         elif not selection and self.selection_callback:
             # No selection - notify with empty string
             self.selection_callback("")
@@ -594,14 +779,9 @@ class SensorPanel:
         # Clear current selection
         self.tree.selection_remove(self.tree.selection())
         
-        if sensor_id:
-            # Find the item with matching sensor ID
-            for item in self.tree.get_children():
-                values = self.tree.item(item)['values']
-                if values and values[0] == sensor_id:
-                    self.tree.selection_set(item)
-                    self.tree.see(item)  # Scroll to make it visible
-                    break
+        if sensor_id and self.tree.exists(sensor_id):
+            self.tree.selection_set(sensor_id)
+            self.tree.see(sensor_id)  # Scroll to make it visible
     
     def set_selection_callback(self, callback):
         """Set callback function for selection changes."""
@@ -609,5 +789,15 @@ class SensorPanel:
     
     def on_simulation_event(self, event):
         """Handle simulation events."""
-        if event.event_type in ['sensor_added', 'sensor_removed', 'sensor_data', 'sensor_activated', 'sensor_deactivated']:
-            self.refresh()
\ No newline at end of file
+        if event.event_type == 'sensor_data':
+            # Telemetry can arrive far faster than the tree needs redrawing
+            if not self._refresh_pending:
+                self._refresh_pending = True
+                self.frame.after(self._min_refresh_ms, self._do_refresh)
+        elif event.event_type in ['sensor_added', 'sensor_removed', 'sensor_activated', 'sensor_deactivated']:
+            self.refresh()
+    
+    def _do_refresh(self):
+        """Run a refresh scheduled by on_simulation_event."""
+        self._refresh_pending = False
+        self.refresh()
\ No newline at end of file
@@ -6,6 +6,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from typing import Dict, List, Optional, Set, Tuple
 import json
+import logging
+import math
 import datetime
 
 from src.sensors.base_sensor import BaseSensor
@@ -14,6 +16,11 @@ from src.system.components import (
     SystemComponent, ComponentStatus, ComponentType
 )
 
+# Cell size in pixels of the click hit-test grid
+_HIT_CELL = 64
+# Click tolerance around a component's bounding box, in pixels
+_HIT_PAD = 5
+
 
 class ConnectionType:
     """Types of connections between components."""
@@ -120,21 +127,26 @@ class SystemView:
         self.sim_engine = simulation_engine
         self.logger = logger
         self.on_component_selected = on_component_selected  # Callback for component selection
+        self.click_callbacks = []  # Extra listeners notified of every canvas click
         
         self.connections = {}  # connection_id -> Connection
         self.controllers = {}  # controller_id -> Controller
         self.selected_component = None
         self.canvas_components = {}  # component_id -> canvas item info
+        self.hit_grid = {}  # (col, row) -> component ids whose bbox covers that grid cell
         
         # Drag and drop variables
         self.drag_item = None
         self.drag_component_id = None
         self.drag_start_x = 0
+        self.arrows_dirty = False  # Set while a drag has moved a component, cleared on release
         self.drag_start_y = 0
         self.last_click_pos = (0, 0)
         
         # Connection drawing variables
         self.connection_lines = {}  # connection_id -> line_id
+        self.connection_endpoints = {}  # connection key -> (source_id, target_id), for in-place updates
+        self.flow_lines = {}  # connection_id -> (line_id, arrow_id, label_id) drawn by draw_connections
         
         # Initialize component manager
         self.component_manager = ComponentManager(logger)
@@ -410,6 +422,10 @@ class SystemView:
         """Refresh the system diagram."""
         self.canvas.delete("all")
         self.canvas_components.clear()
+        self.hit_grid.clear()
+        self.connection_lines.clear()
+        self.connection_endpoints.clear()
+        self.flow_lines.clear()
         
         # Draw system components
         system_components = list(self.component_manager.components.values())
@@ -473,8 +489,10 @@ class SystemView:
             'type': 'sensor',
             'object': sensor,
             'position': (x, y),
-            'canvas_ids': [rect_id, label_id]
+            'canvas_ids': [rect_id, label_id],
+            'tag': f"sensor_{sensor.sensor_id}"
         }
+        self.index_component(sensor.sensor_id)
         
         # Bind events
         for item_id in [rect_id, label_id]:
@@ -506,8 +524,10 @@ class SystemView:
             'type': 'controller',
             'object': controller,
             'position': (x, y),
-            'canvas_ids': [shape_id, label_id]
+            'canvas_ids': [shape_id, label_id],
+            'tag': f"controller_{controller.controller_id}"
         }
+        self.index_component(controller.controller_id)
         
         # Bind events
         for item_id in [shape_id, label_id]:
@@ -529,17 +549,19 @@ class SystemView:
                 line_width = 3 if connection.connection_type in [ConnectionType.HTTP, ConnectionType.WEBSOCKET] else 2
                 
                 line_id = self.canvas.create_line(sx, sy, tx, ty, fill=line_color, width=line_width,
-                                                tags=f"connection_{connection.connection_id}")
+                                                tags=("connection", f"connection_{connection.connection_id}"))
                 
                 # Draw arrow
                 mid_x, mid_y = (sx + tx) // 2, (sy + ty) // 2
                 arrow_id = self.canvas.create_polygon([mid_x-5, mid_y-5, mid_x+5, mid_y, mid_x-5, mid_y+5],
-                                                   fill=line_color, tags=f"connection_{connection.connection_id}")
+                                                   fill=line_color, tags=("connection", f"connection_{connection.connection_id}"))
                 
                 # Connection label
                 label_text = f"{connection.connection_type}\n{connection.data_format}"
                 label_id = self.canvas.create_text(mid_x, mid_y-20, text=label_text, font=('Arial', 6),
-                                                 tags=f"connection_{connection.connection_id}")
+                                                 tags=("connection", f"connection_{connection.connection_id}"))
+                
+                self.flow_lines[connection.connection_id] = (line_id, arrow_id, label_id)
     
     def calculate_sensor_positions(self, sensors: List[BaseSensor]) -> List[Tuple[int, int]]:
         """Calculate positions for sensors in a grid layout."""
@@ -640,8 +662,10 @@ class SystemView:
             'type': 'system_component',
             'object': component,
             'position': (x, y),
-            'canvas_ids': [rect_id, icon_id, label_id, status_id]
+            'canvas_ids': [rect_id, icon_id, label_id, status_id],
+            'tag': f"system_{component.component_id}"
         }
+        self.index_component(component.component_id)
         
         # Bind events
         for item_id in [rect_id, icon_id, label_id, status_id]:
@@ -1317,6 +1341,15 @@ class SystemView:
                 obj = info['object']
                 component_name = f"{info['type'].title()}: {obj.name}"
                 self.on_component_selected(component_id, component_name)
+        
+        self.canvas.event_generate("<<SelectionChanged>>")
+    
+    def clear_selection(self):
+        """Clear the current selection."""
+        self.selected_component = None
+        self.canvas.delete("selection")
+        self.selected_component_label.config(text="No component selected")
+        self.canvas.event_generate("<<SelectionChanged>>")
     
     def update_config_panel(self, component_id: str, component_info: dict):
         """Update the configuration panel with selected component details."""
@@ -1349,43 +1382,37 @@ class SystemView:
             self.component_config_text.insert(1.0, json.dumps(obj.config, indent=2))
     
     # Event handlers
+    def add_click_callback(self, callback):
+        """Add a function called with every canvas click event, before selection is handled."""
+        self.click_callbacks.append(callback)
+    
+    def remove_click_callback(self, callback):
+        """Remove a canvas click callback."""
+        if callback in self.click_callbacks:
+            self.click_callbacks.remove(callback)
+    
     def on_canvas_click(self, event):
         """Handle canvas click."""
         # Store click position
         self.last_click_pos = (event.x, event.y)
         
+        # Fan out to listeners from the single Tk binding
+        for callback in self.click_callbacks:
+            try:
+                callback(event)
+            except Exception as e:
+                self.logger.error(f"Error in click callback: {e}")
+        
         # Convert to canvas coordinates if needed (for scrollable canvas)
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
         
-        # Find clicked item using canvas coordinates
-        items = self.canvas.find_overlapping(canvas_x-5, canvas_y-5, canvas_x+5, canvas_y+5)
-        
-        # Find the topmost item that's not a connection or selection
-        clicked_item = None
-        for item in reversed(items):  # reversed to get topmost item first
-            tags = self.canvas.gettags(item)
-            # Skip connection lines and selection rectangles
-            if not any(tag.startswith(('connection_', 'selection')) for tag in tags):
-                clicked_item = item
-                break
-        
-        if clicked_item:
-            tags = self.canvas.gettags(clicked_item)
-        else:
-            tags = []
-        
-        # Check if clicking on a draggable component
-        draggable_component_id = None
-        for tag in tags:
-            if tag.startswith(('sensor_', 'controller_', 'system_')):
-                # Extract component ID from tag
-                draggable_component_id = tag.split('_', 1)[1] if '_' in tag else None
-                break
+        # Look the click up in the hit-test grid instead of scanning canvas items
+        draggable_component_id = self.component_at(canvas_x, canvas_y)
         
         if draggable_component_id:
             # Set up for potential drag
-            self.drag_item = clicked_item
+            self.drag_item = self.canvas_components[draggable_component_id]['canvas_ids'][0]
             self.drag_component_id = draggable_component_id
             self.drag_start_x = canvas_x
             self.drag_start_y = canvas_y
@@ -1394,9 +1421,7 @@ class SystemView:
             self.select_component(draggable_component_id)
         else:
             # Clear selection if clicking on empty space
-            self.selected_component = None
-            self.canvas.delete("selection")
-            self.selected_component_label.config(text="No component selected")
+            self.clear_selection()
             
             # Clear drag state
             self.drag_item = None
@@ -1422,14 +1447,11 @@ class SystemView:
             
             # Only start drag if moved far enough (prevents accidental drags)
             if abs(dx) > 3 or abs(dy) > 3:
-                # Clear old arrows before moving component
-                self.clear_all_connections()
-                
                 self.move_component(self.drag_component_id, dx, dy)
                 
-                # Redraw all connections with updated positions for real-time feedback
-                self.draw_connections()
-                self.draw_system_connections()
+                # Move the existing arrows touching this component for real-time feedback
+                self.update_connection_endpoints(self.drag_component_id)
+                self.arrows_dirty = True
                 
                 # Update drag start position for continuous dragging
                 self.drag_start_x = canvas_x
@@ -1437,12 +1459,14 @@ class SystemView:
     
     def on_canvas_release(self, event):
         """Handle canvas mouse release."""
-        if self.drag_item and self.drag_component_id:
+        if self.drag_item and self.drag_component_id and self.arrows_dirty:
             # Update component position in storage
             self.update_component_position(self.drag_component_id)
             
-            # Redraw connections to update arrow positions
+            # One full arrow redraw per drag; a plain click leaves the arrows alone
             self.redraw_connections()
+            self.arrows_dirty = False
+            self.canvas.event_generate("<<DragEnd>>")
         
         # Clear drag state
         self.drag_item = None
@@ -1454,7 +1478,7 @@ class SystemView:
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         
         # Optional: Log resize for debugging
-        if hasattr(self, 'logger'):
+        if self.logger.isEnabledFor(logging.DEBUG):
             self.logger.debug(f"Canvas resized to {event.width}x{event.height}")
     
     def move_component(self, component_id: str, dx: int, dy: int):
@@ -1462,19 +1486,75 @@ class SystemView:
         if component_id in self.canvas_components:
             component_info = self.canvas_components[component_id]
             
-            # Move all canvas items for this component
-            for canvas_id in component_info['canvas_ids']:
-                self.canvas.move(canvas_id, dx, dy)
+            # Move all canvas items for this component with one tag move, and raise them:
+            # the hit grid treats the last moved component as topmost, so the canvas must agree
+            self.canvas.move(component_info['tag'], dx, dy)
+            self.canvas.tag_raise(component_info['tag'])
             
             # Update stored position
             old_x, old_y = component_info['position']
             component_info['position'] = (old_x + dx, old_y + dy)
             
-            # Move selection rectangle if this component is selected
+            # Shift the hit-test box with the component
+            self.unindex_component(component_id)
+            x1, y1, x2, y2 = component_info['bbox']
+            component_info['bbox'] = (x1 + dx, y1 + dy, x2 + dx, y2 + dy)
+            self.index_component(component_id, component_info['bbox'])
+            
+            # Move selection rectangle if this component is selected, keeping it above the component
             if self.selected_component == component_id:
-                selection_items = self.canvas.find_withtag("selection")
-                for item in selection_items:
-                    self.canvas.move(item, dx, dy)
+                self.canvas.move("selection", dx, dy)
+                self.canvas.tag_raise("selection")
+    
+    def index_component(self, component_id: str, bbox: Optional[Tuple[int, int, int, int]] = None):
+        """Add a component's bounding box to the click hit-test grid."""
+        info = self.canvas_components[component_id]
+        if bbox is None:
+            bbox = self.canvas_hit_box(component_id)
+            info['bbox'] = bbox
+        x1, y1, x2, y2 = bbox
+        for col in range(int(x1) // _HIT_CELL, int(x2) // _HIT_CELL + 1):
+            for row in range(int(y1) // _HIT_CELL, int(y2) // _HIT_CELL + 1):
+                self.hit_grid.setdefault((col, row), []).append(component_id)
+    
+    def canvas_hit_box(self, component_id: str) -> Tuple[int, int, int, int]:
+        """Padded hit box measured from the component's items on the canvas (one Tcl call)."""
+        x1, y1, x2, y2 = self.canvas.bbox(*self.canvas_components[component_id]['canvas_ids'])
+        return (x1 - _HIT_PAD, y1 - _HIT_PAD, x2 + _HIT_PAD, y2 + _HIT_PAD)
+    
+    def unindex_component(self, component_id: str):
+        """Remove a component from the click hit-test grid."""
+        x1, y1, x2, y2 = self.canvas_components[component_id]['bbox']
+        for col in range(int(x1) // _HIT_CELL, int(x2) // _HIT_CELL + 1):
+            for row in range(int(y1) // _HIT_CELL, int(y2) // _HIT_CELL + 1):
+                cell = self.hit_grid.get((col, row))
+                if cell and component_id in cell:
+                    cell.remove(component_id)
+                    if not cell:
+                        del self.hit_grid[(col, row)]
+    
+    def reindex_component(self, component_id: str):
+        """Re-measure a component's hit box after its items were changed in place (e.g. itemconfigure)."""
+        self.unindex_component(component_id)
+        self.index_component(component_id)
+    
+    def component_at(self, x: float, y: float) -> Optional[str]:
+        """Return the topmost component whose (padded) bounding box contains a canvas point.
+        
+        Hit boxes are measured when a component is drawn and shifted by move_component;
+        anything else that resizes a component's items must call reindex_component.
+        """
+        candidates = self.hit_grid.get((int(x) // _HIT_CELL, int(y) // _HIT_CELL))
+        if not candidates:
+            return None
+        
+        # Cell lists follow the stacking order: drawing appends, and move_component both
+        # re-appends and tag_raises the moved component, so the last entry is topmost
+        for component_id in reversed(candidates):
+            x1, y1, x2, y2 = self.canvas_components[component_id]['bbox']
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return component_id
+        return None
     
     def update_component_position(self, component_id: str):
         """Update the stored position of a component after dragging."""
@@ -1482,75 +1562,36 @@ class SystemView:
             component_info = self.canvas_components[component_id]
             # Position is already updated in move_component, but we could
             # trigger additional actions here if needed
-            self.logger.debug(f"Component {component_id} moved to {component_info['position']}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Component {component_id} moved to {component_info['position']}")
     
     def redraw_connections(self):
         """Redraw all connection arrows after components have moved."""
-        # Clear existing connection lines
-        for line_id in self.connection_lines.values():
-            self.canvas.delete(line_id)
-        self.connection_lines.clear()
+        self.clear_all_connections()
         
-        # Redraw all connections
+        # Redraw both user and system connections
+        self.draw_connections()
         self.draw_system_connections()
     
     def clear_connection_arrows(self):
         """Clear all connection arrows from the canvas."""
-        # Clear existing connection lines by IDs
-        for line_ids in self.connection_lines.values():
-            if isinstance(line_ids, list):
-                for line_id in line_ids:
-                    try:
-                        self.canvas.delete(line_id)
-                    except:
-                        pass  # Item might already be deleted
-            else:
-                try:
-                    self.canvas.delete(line_ids)
-                except:
-                    pass  # Item might already be deleted
+        # Every connection item carries the shared "connection" tag
+        self.canvas.delete("connection")
         self.connection_lines.clear()
-        
-        # Also delete any items with connection tags (for extra safety)
-        connection_items = self.canvas.find_withtag("connection_")
-        for item in connection_items:
-            self.canvas.delete(item)
-        
-        # Delete items that start with "connection_" in their tags
-        all_items = self.canvas.find_all()
-        for item in all_items:
-            tags = self.canvas.gettags(item)
-            for tag in tags:
-                if tag.startswith("connection_"):
-                    try:
-                        self.canvas.delete(item)
-                    except:
-                        pass
-                    break
+        self.connection_endpoints.clear()
+        self.flow_lines.clear()
+    
+    def style_connections(self, **options):
+        """Apply item options (e.g. fill) to every connection item in one call; redraws restore the defaults."""
+        self.canvas.itemconfigure("connection", **options)
+    
+    def style_selection(self, **options):
+        """Apply item options (e.g. outline) to the selection rectangle."""
+        self.canvas.itemconfigure("selection", **options)
     
     def clear_all_connections(self):
         """Clear all connections from canvas - both user and system connections."""
-        # Clear connection arrows first
         self.clear_connection_arrows()
-        
-        # Clear any remaining connection-related canvas items by tag pattern
-        # Find all canvas items and check their tags
-        all_items = self.canvas.find_all()
-        items_to_delete = []
-        
-        for item in all_items:
-            tags = self.canvas.gettags(item)
-            for tag in tags:
-                if 'connection' in tag.lower():
-                    items_to_delete.append(item)
-                    break
-        
-        # Delete the identified items
-        for item in items_to_delete:
-            try:
-                self.canvas.delete(item)
-            except:
-                pass  # Item might already be deleted
     
     def draw_system_connections(self):
         """Draw connection arrows between system components."""
@@ -1579,9 +1620,47 @@ class SystemView:
         if source_id not in self.canvas_components or target_id not in self.canvas_components:
             return None
             
-        source_pos = self.canvas_components[source_id]['position']
-        target_pos = self.canvas_components[target_id]['position']
+        geometry = self._arrow_geometry(self.canvas_components[source_id]['position'],
+                                        self.canvas_components[target_id]['position'])
+        if geometry is None:
+            return None
+        start_x, start_y, end_x, end_y, label_x, label_y = geometry
+        
+        # Connection colors by type
+        connection_colors = {
+            'HTTP': '#FF6B6B',
+            'MQTT': '#4ECDC4', 
+            'DATA': '#45B7D1',
+            'TCP': '#96CEB4',
+            'UDP': '#FFEAA7',
+            'WebSocket': '#DDA0DD'
+        }
+        
+        color = connection_colors.get(connection_type, '#666666')
         
+        # Draw the line
+        line_id = self.canvas.create_line(
+            start_x, start_y, end_x, end_y,
+            fill=color, width=2, arrow=tk.LAST, arrowshape=(16, 20, 6),
+            tags=("connection", f"connection_{connection_id or f'{source_id}_{target_id}'}")
+        )
+        
+        # Draw connection label
+        label_id = self.canvas.create_text(
+            label_x, label_y, text=connection_type,
+            font=('Arial', 8), fill=color,
+            tags=("connection", f"connection_{connection_id or f'{source_id}_{target_id}'}")
+        )
+        
+        # Store connection line IDs
+        conn_key = connection_id or f"{source_id}_{target_id}"
+        self.connection_lines[conn_key] = [line_id, label_id]
+        self.connection_endpoints[conn_key] = (source_id, target_id)
+        
+        return line_id
+    
+    def _arrow_geometry(self, source_pos, target_pos):
+        """Line endpoints at the component edges and label position, or None if the components coincide."""
         # Calculate connection points (edge of components rather than center)
         source_x, source_y = source_pos
         target_x, target_y = target_pos
@@ -1590,7 +1669,6 @@ class SystemView:
         component_radius = 60  # Half the width of component rectangles
         
         # Calculate direction vector
-        import math
         dx = target_x - source_x
         dy = target_y - source_y
         distance = math.sqrt(dx*dx + dy*dy)
@@ -1608,26 +1686,6 @@ class SystemView:
         end_x = target_x - dx_norm * component_radius
         end_y = target_y - dy_norm * component_radius
         
-        # Connection colors by type
-        connection_colors = {
-            'HTTP': '#FF6B6B',
-            'MQTT': '#4ECDC4', 
-            'DATA': '#45B7D1',
-            'TCP': '#96CEB4',
-            'UDP': '#FFEAA7',
-            'WebSocket': '#DDA0DD'
-        }
-        
-        color = connection_colors.get(connection_type, '#666666')
-        
-        # Draw the line
-        line_id = self.canvas.create_line(
-            start_x, start_y, end_x, end_y,
-            fill=color, width=2, arrow=tk.LAST, arrowshape=(16, 20, 6),
-            tags=f"connection_{connection_id or f'{source_id}_{target_id}'}"
-        )
-        
-        # Draw connection label
         mid_x = (start_x + end_x) / 2
         mid_y = (start_y + end_y) / 2
         
@@ -1636,17 +1694,38 @@ class SystemView:
         label_x = mid_x + label_offset if dx >= 0 else mid_x - label_offset
         label_y = mid_y - label_offset
         
-        label_id = self.canvas.create_text(
-            label_x, label_y, text=connection_type,
-            font=('Arial', 8), fill=color,
-            tags=f"connection_{connection_id or f'{source_id}_{target_id}'}"
-        )
-        
-        # Store connection line IDs
-        conn_key = connection_id or f"{source_id}_{target_id}"
-        self.connection_lines[conn_key] = [line_id, label_id]
-        
-        return line_id
+        return start_x, start_y, end_x, end_y, label_x, label_y
+    
+    def update_connection_endpoints(self, component_id: str):
+        """Move the already-drawn connections touching a component to its current position."""
+        positions = self.canvas_components
+        
+        for conn_key, (source_id, target_id) in self.connection_endpoints.items():
+            if component_id != source_id and component_id != target_id:
+                continue
+            if source_id not in positions or target_id not in positions:
+                continue
+            geometry = self._arrow_geometry(positions[source_id]['position'], positions[target_id]['position'])
+            if geometry is None:
+                continue
+            start_x, start_y, end_x, end_y, label_x, label_y = geometry
+            line_id, label_id = self.connection_lines[conn_key]
+            self.canvas.coords(line_id, start_x, start_y, end_x, end_y)
+            self.canvas.coords(label_id, label_x, label_y)
+        
+        # Connections drawn by draw_connections: center-to-center line with a midpoint arrow
+        for connection_id, (line_id, arrow_id, label_id) in self.flow_lines.items():
+            connection = self.connections.get(connection_id)
+            if connection is None or component_id not in (connection.source_id, connection.target_id):
+                continue
+            if connection.source_id not in positions or connection.target_id not in positions:
+                continue
+            sx, sy = positions[connection.source_id]['position']
+            tx, ty = positions[connection.target_id]['position']
+            mid_x, mid_y = (sx + tx) // 2, (sy + ty) // 2
+            self.canvas.coords(line_id, sx, sy, tx, ty)
+            self.canvas.coords(arrow_id, mid_x-5, mid_y-5, mid_x+5, mid_y, mid_x-5, mid_y+5)
+            self.canvas.coords(label_id, mid_x, mid_y-20)
     
     def on_connection_select(self, event):
         """Handle connection selection in tree view."""
@@ -1737,7 +1816,7 @@ class SystemView:
             for conn_id in connections_to_remove:
                 del self.connections[conn_id]
             
-            self.selected_component = None
+            self.clear_selection()
             self.refresh_diagram()
     
     def update_connection(self):
@@ -4,8 +4,9 @@ Templates dialog for selecting home templates.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
 import os
+from collections import OrderedDict
+from functools import lru_cache
 
 try:
     from PIL import Image, ImageTk
@@ -13,6 +14,23 @@ try:
 except ImportError:
     PIL_AVAILABLE = False
 
+from templates import load_templates as _read_templates
+
+# Project root (go up from src/gui/templates_dialog.py to project root)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_TEMPLATE_PATH = os.path.join(_PROJECT_ROOT, 'templates', 'home_templates.json')
+
+# Number of resized preview images kept per dialog
+_THUMBNAIL_CACHE_SIZE = 32
+
+
+@lru_cache(maxsize=64)
+def _resolve_image(image_path):
+    """Resolve a template image path relative to the project root."""
+    if os.path.isabs(image_path):
+        return image_path
+    return os.path.join(_PROJECT_ROOT, image_path)
+
 
 class TemplatesDialog:
     """Dialog for selecting home templates."""
@@ -23,6 +41,7 @@ class TemplatesDialog:
         self.logger = logger
         self.selected_template = None
         self.preview_photo = None  # Keep reference to PhotoImage
+        self._thumb_cache = OrderedDict()  # (path, mtime) -> PhotoImage
         
         self.create_dialog()
     
@@ -103,16 +122,14 @@ class TemplatesDialog:
     def load_templates(self):
         """Load available templates from JSON file."""
         try:
-            # Load from JSON file - get project root from src/gui/templates_dialog.py
-            current_dir = os.path.dirname(os.path.abspath(__file__))  # src/gui/
-            gui_dir = os.path.dirname(current_dir)  # src/
-            project_root = os.path.dirname(gui_dir)  # project root
-            template_path = os.path.join(project_root, 'templates', 'home_templates.json')
+            template_path = _TEMPLATE_PATH
             
             if os.path.exists(template_path):
-                with open(template_path, 'r') as f:
-                    self.templates = json.load(f)
-                    
+                # Shared loader: parsed once per file version, copied per caller
+                self.templates = _read_templates()
+                if not self.templates:
+                    raise ValueError(f"No templates could be read from {template_path}")
+                
                 # Add display names and compatibility fields if needed
                 for key, template in self.templates.items():
                     if 'name' not in template:
@@ -150,10 +167,18 @@ class TemplatesDialog:
                 }
             }
         
-        # Populate listbox
+        # Populate listbox, indexing templates by the name shown for them
+        self._display_to_key = {}
+        self._display_to_template = {}
+        display_names = []
         for name, template in self.templates.items():
             display_name = template.get('name', name.replace('_', ' ').title())
-            self.template_listbox.insert(tk.END, display_name)
+            self._display_to_key[display_name] = name
+            self._display_to_template[display_name] = template
+            display_names.append(display_name)
+        
+        # Insert all names in a single Tcl call instead of one per template
+        self.template_listbox.insert(tk.END, *display_names)
         
         # Select first template by default
         if self.templates:
@@ -165,15 +190,7 @@ class TemplatesDialog:
         selection = self.template_listbox.curselection()
         if selection:
             template_display_name = self.template_listbox.get(selection[0])
-            
-            # Find template by display name
-            template = None
-            template_key = None
-            for key, tmpl in self.templates.items():
-                if tmpl.get('name', key.replace('_', ' ').title()) == template_display_name:
-                    template = tmpl
-                    template_key = key
-                    break
+            template = self._display_to_template.get(template_display_name)
             
             if template:
                 # Update text preview
@@ -211,25 +228,31 @@ class TemplatesDialog:
             return
             
         try:
-            # Construct full path
-            if not os.path.isabs(image_path):
-                # Get project root (go up from src/gui/templates_dialog.py to project root)
-                current_dir = os.path.dirname(os.path.abspath(__file__))  # src/gui/
-                gui_dir = os.path.dirname(current_dir)  # src/
-                project_root = os.path.dirname(gui_dir)  # project root
-                full_path = os.path.join(project_root, image_path)
-            else:
-                full_path = image_path
+            full_path = _resolve_image(image_path)
                 
             if os.path.exists(full_path):
-                # Load and resize image for preview
-                image = Image.open(full_path)
+                # Reuse the preview if this image was already resized and is unchanged
+                cache_key = (full_path, os.path.getmtime(full_path))
+                if cache_key in self._thumb_cache:
+                    self._thumb_cache.move_to_end(cache_key)
+                    self.preview_photo = self._thumb_cache[cache_key]
+                    self.preview_image_label.config(image=self.preview_photo, text="")
+                    return
                 
-                # Resize to fit preview area (max 150x150)
-                image.thumbnail((150, 150), Image.Resampling.LANCZOS)
+                # Load and resize image for preview
+                with Image.open(full_path) as image:
+                    # Let JPEG decoding scale down while reading (no-op for other formats)
+                    image.draft('RGB', (150, 150))
+                    
+                    # Resize to fit preview area (max 150x150)
+                    image.thumbnail((150, 150), Image.Resampling.LANCZOS)
+                    
+                    # Convert to PhotoImage
+                    self.preview_photo = ImageTk.PhotoImage(image)
                 
-                # Convert to PhotoImage
-                self.preview_photo = ImageTk.PhotoImage(image)
+                self._thumb_cache[cache_key] = self.preview_photo
+                if len(self._thumb_cache) > _THUMBNAIL_CACHE_SIZE:
+                    self._thumb_cache.popitem(last=False)
                 
                 # Update label
                 self.preview_image_label.config(image=self.preview_photo, text="")
@@ -249,12 +272,11 @@ class TemplatesDialog:
         if selection:
             template_display_name = self.template_listbox.get(selection[0])
             
-            # Find template by display name
-            for key, template in self.templates.items():
-                if template.get('name', key.replace('_', ' ').title()) == template_display_name:
-                    self.selected_template = template.copy()
-                    self.selected_template['_template_key'] = key  # Keep track of original key
-                    break
+            template = self._display_to_template.get(template_display_name)
+            if template:
+                self.selected_template = template.copy()
+                # Keep track of original key
+                self.selected_template['_template_key'] = self._display_to_key[template_display_name]
             
             self.dialog.destroy()
         else:
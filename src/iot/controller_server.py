@@ -526,7 +526,9 @@ finally:
         elif command.command_type == "set_config":
             # Update sensor configuration
             config = command.parameters.get('config', {})
-            sensor.config.update(config)
+            if not sensor.update_config(config):
+                command.error = "Invalid sensor configuration"
+                return False
             command.result = {"config_updated": True, "new_config": sensor.config}
             return True
         else:
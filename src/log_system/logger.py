@@ -6,39 +6,92 @@ import logging
 import logging.handlers
 import os
 import threading
+from collections import Counter, deque
+from itertools import chain, count, islice
 from datetime import datetime
-from typing import List, Dict, Any, Callable, Optional
-from queue import Queue, Empty
+from typing import List, Dict, Any, Callable, Optional, Deque
+from queue import SimpleQueue, Empty
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Standard logging levels by SmartHomeLogRecord level name
+_LEVEL_MAP = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL
+}
+
+# Lowest level kept by default, in the files and in memory; matches
+# logging.level in config/default_settings.json
+_DEFAULT_LEVEL = logging.INFO
+
+# Maximum number of queued records processed in one pass
+_MAX_BATCH_SIZE = 256
+
 
 class SmartHomeLogRecord:
     """Enhanced log record for smart home events."""
     
+    __slots__ = ('timestamp', 'level', 'message', 'category', 'extra_data',
+                 '_level_pad', '_cat_pad', '_message_lower', '_rid_int')
+    
+    # Monotonic source of record IDs (next() on a count is atomic under the GIL)
+    _id_counter = count()
+    
+    # Shared by all records logged without extra data; never mutate it
+    _EMPTY: Dict[str, Any] = {}
+    
     def __init__(self, level: str, message: str, category: str = "general", 
                  timestamp: Optional[datetime] = None, extra_data: Dict[str, Any] = None):
         self.timestamp = timestamp or datetime.now()
         self.level = level
         self.message = message
         self.category = category  # general, sensor, rule, security, simulation
-        self.extra_data = extra_data or {}
-        self.record_id = f"{self.timestamp.timestamp()}_{id(self)}"
+        self.extra_data = extra_data if extra_data else SmartHomeLogRecord._EMPTY
+        
+        # Padded columns for format_message, computed once per record
+        self._level_pad = level.ljust(8)
+        self._cat_pad = category.ljust(10)
+        self._message_lower = None
+        self._rid_int = next(SmartHomeLogRecord._id_counter)
+    
+    @property
+    def record_id(self) -> str:
+        """Unique identifier of this record, formatted only when needed."""
+        return str(self._rid_int)
+    
+    @property
+    def message_lower(self) -> str:
+        """Lowercased message, computed on first use by case-insensitive searches."""
+        if self._message_lower is None:
+            self._message_lower = self.message.lower()
+        return self._message_lower
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert log record to dictionary."""
-        return {
+        """Convert log record to dictionary (extra_data is omitted when empty)."""
+        data = {
             'record_id': self.record_id,
             'timestamp': self.timestamp.isoformat(),
             'level': self.level,
             'message': self.message,
-            'category': self.category,
-            'extra_data': self.extra_data
+            'category': self.category
         }
+        if self.extra_data:
+            data['extra_data'] = self.extra_data
+        return data
     
     def format_message(self) -> str:
         """Format message for display."""
-        time_str = self.timestamp.strftime("%H:%M:%S.%f")[:-3]
-        return f"[{time_str}] {self.level:8} [{self.category:10}] {self.message}"
+        t = self.timestamp
+        return (f"[{t.hour:02d}:{t.minute:02d}:{t.second:02d}.{t.microsecond // 1000:03d}] "
+                f"{self._level_pad} [{self._cat_pad}] {self.message}")
 
 
 class LogHandler:
@@ -69,19 +122,29 @@ class SmartHomeLogger:
         self.ensure_log_directory()
         
         # Log storage
-        self.log_records: List[SmartHomeLogRecord] = []
         self.max_records = 10000  # Keep last 10k records in memory
+        self.log_records: Deque[SmartHomeLogRecord] = deque(maxlen=self.max_records)
+        self.store_level = _DEFAULT_LEVEL  # Lowest level kept in memory
+        
+        # Filtered views used by windowed queries, invalidated on every append
+        self._records_version = 0
+        self._filtered_cache: Dict[tuple, tuple] = {}
+        
+        # Running counts for get_statistics, kept in step with log_records
+        self._level_counts: Counter = Counter()
+        self._category_counts: Counter = Counter()
         
         # Handlers
         self.handlers: List[LogHandler] = []
         
         # Threading
-        self.log_queue = Queue()
+        self.log_queue = SimpleQueue()
         self.log_thread = None
         self.shutdown_event = threading.Event()
         
         # File logging
         self.file_logger = self.setup_file_logger()
+        self._update_min_level()
         
         # Start log processing thread
         self.start_log_thread()
@@ -90,13 +153,13 @@ class SmartHomeLogger:
     
     def ensure_log_directory(self):
         """Ensure log directory exists."""
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+        # exist_ok: several loggers (e.g. in parallel test workers) may create it at once
+        os.makedirs(self.log_dir, exist_ok=True)
     
     def setup_file_logger(self) -> logging.Logger:
         """Setup file-based logging."""
         logger = logging.getLogger("smarthome")
-        logger.setLevel(logging.DEBUG)
+        logger.setLevel(_DEFAULT_LEVEL)
         
         # Remove existing handlers
         for handler in logger.handlers[:]:
@@ -137,35 +200,65 @@ class SmartHomeLogger:
         """Process log records in separate thread."""
         while not self.shutdown_event.is_set():
             try:
-                # Get log record from queue (with timeout)
-                record = self.log_queue.get(timeout=1.0)
-                
-                # Add to memory storage
-                self.log_records.append(record)
-                
-                # Trim old records if needed
-                if len(self.log_records) > self.max_records:
-                    self.log_records = self.log_records[-self.max_records:]
-                
-                # Log to file
-                extra = {'category': record.category}
-                if record.extra_data:
-                    extra.update(record.extra_data)
-                
-                log_level = getattr(logging, record.level.upper(), logging.INFO)
-                self.file_logger.log(log_level, record.message, extra=extra)
+                # Get log record from queue (with timeout), then drain whatever
+                # else is already waiting so bursts are handled in one pass
+                batch = [self.log_queue.get(timeout=1.0)]
+                while len(batch) < _MAX_BATCH_SIZE:
+                    try:
+                        batch.append(self.log_queue.get_nowait())
+                    except Empty:
+                        break
                 
-                # Call handlers
-                for handler in self.handlers:
-                    handler.handle(record)
+                # Add to memory storage (the deque drops the oldest records when full)
+                stored = batch
+                if self.store_level > logging.DEBUG:
+                    stored = [r for r in batch
+                              if _LEVEL_MAP.get(r.level, logging.CRITICAL) >= self.store_level]
+                if stored:
+                    self._update_counts(stored)
+                    self.log_records.extend(stored)
+                    self._records_version += 1
                 
-                self.log_queue.task_done()
+                for record in batch:
+                    # Log to file
+                    extra = {'category': record.category}
+                    if record.extra_data:
+                        extra.update(record.extra_data)
+                    
+                    log_level = _LEVEL_MAP.get(record.level)
+                    if log_level is None:
+                        log_level = _LEVEL_MAP.get(record.level.upper(), logging.INFO)
+                    self.file_logger.log(log_level, record.message, extra=extra)
+                    
+                    # Call handlers
+                    for handler in self.handlers:
+                        handler.handle(record)
                 
             except Empty:
                 continue
             except Exception as e:
                 print(f"Error in log processor: {e}")
     
+    def _update_counts(self, batch: List[SmartHomeLogRecord]):
+        """Update statistics counters for records about to be added and evicted."""
+        level_counts = self._level_counts
+        category_counts = self._category_counts
+        
+        for record in batch:
+            level_counts[record.level] += 1
+            category_counts[record.category] += 1
+        
+        # The deque drops its oldest entries (and possibly early batch entries)
+        evicted = len(self.log_records) + len(batch) - self.max_records
+        if evicted > 0:
+            for record in islice(chain(self.log_records, batch), evicted):
+                level_counts[record.level] -= 1
+                if not level_counts[record.level]:
+                    del level_counts[record.level]
+                category_counts[record.category] -= 1
+                if not category_counts[record.category]:
+                    del category_counts[record.category]
+    
     def shutdown(self):
         """Shutdown the logger."""
         self.shutdown_event.set()
@@ -175,19 +268,57 @@ class SmartHomeLogger:
     def add_handler(self, handler: LogHandler):
         """Add a log handler."""
         self.handlers.append(handler)
+        self._update_min_level()
     
     def remove_handler(self, handler: LogHandler):
         """Remove a log handler."""
         if handler in self.handlers:
             self.handlers.remove(handler)
+        self._update_min_level()
+    
+    def set_file_level(self, level: int):
+        """Set the lowest level written to the log files."""
+        self.file_logger.setLevel(level)
+        self._update_min_level()
+    
+    def set_store_level(self, level: int):
+        """Set the lowest level kept in memory for get_logs and the log viewer."""
+        self.store_level = level
+        self._update_min_level()
+    
+    def _update_min_level(self):
+        """Recompute the lowest level any consumer of log records accepts.
+        
+        Call again after changing file logger or file handler levels directly;
+        set_file_level and set_store_level do this themselves.
+        """
+        file_levels = [h.level for h in self.file_logger.handlers]
+        min_level = max(self.file_logger.level, min(file_levels)) if file_levels else logging.CRITICAL
+        
+        # The in-memory store backs get_logs, get_recent_logs and the log viewer
+        min_level = min(min_level, self.store_level)
+        
+        # Log handlers receive every record
+        if self.handlers:
+            min_level = min(min_level, logging.DEBUG)
+        
+        self._min_level_int = min_level
+    
+    def isEnabledFor(self, level: int) -> bool:
+        """Whether a record at this numeric level would reach any consumer (mirrors logging.Logger)."""
+        return level >= self._min_level_int
     
     def log(self, level: str, message: str, category: str = "general", 
             extra_data: Dict[str, Any] = None):
         """Log a message."""
+        # Skip building records nobody would receive
+        if _LEVEL_MAP.get(level, logging.CRITICAL) < self._min_level_int:
+            return
+        
         record = SmartHomeLogRecord(level, message, category, extra_data=extra_data)
         
         try:
-            self.log_queue.put(record, timeout=1.0)
+            self.log_queue.put(record)
         except Exception as e:
             print(f"Failed to queue log record: {e}")
     
@@ -265,38 +396,74 @@ class SmartHomeLogger:
     def get_recent_logs(self, count: int = 100, level_filter: str = None, 
                        category_filter: str = None) -> List[SmartHomeLogRecord]:
         """Get recent log records with optional filtering."""
-        records = self.log_records[-count:] if count > 0 else self.log_records
-        
-        # Apply filters
-        if level_filter:
-            records = [r for r in records if r.level == level_filter.upper()]
+        if count > 0:
+            records = list(islice(self.log_records, max(0, len(self.log_records) - count), None))
+        else:
+            records = list(self.log_records)
         
+        # Apply filters in a single pass, specialized on which filters are set
+        level = level_filter.upper() if level_filter else None
+        if level and category_filter:
+            return [r for r in records if r.level == level and r.category == category_filter]
+        if level:
+            return [r for r in records if r.level == level]
         if category_filter:
-            records = [r for r in records if r.category == category_filter]
+            return [r for r in records if r.category == category_filter]
+        return records
+    
+    def get_logs_window(self, offset: int, limit: int, level_filter: str = None,
+                        category_filter: str = None) -> List[SmartHomeLogRecord]:
+        """Get the slice of (optionally filtered) log records a view needs to display."""
+        if not level_filter and not category_filter:
+            return list(islice(self.log_records, offset, offset + limit))
         
+        return self._get_filtered_records(level_filter, category_filter)[offset:offset + limit]
+    
+    def len_filtered(self, level_filter: str = None, category_filter: str = None) -> int:
+        """Get the number of log records matching the filters."""
+        if not level_filter and not category_filter:
+            return len(self.log_records)
+        
+        return len(self._get_filtered_records(level_filter, category_filter))
+    
+    def _get_filtered_records(self, level_filter: str = None,
+                              category_filter: str = None) -> List[SmartHomeLogRecord]:
+        """Get filtered log records, reusing the last result until new records arrive."""
+        level = level_filter.upper() if level_filter else None
+        key = (level, category_filter)
+        version = self._records_version
+        
+        cached = self._filtered_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        records = [r for r in list(self.log_records)
+                   if (not level or r.level == level)
+                   and (not category_filter or r.category == category_filter)]
+        
+        # Only the current version is ever reused, so drop stale entries
+        if any(v != version for v, _ in self._filtered_cache.values()):
+            self._filtered_cache = {}
+        self._filtered_cache[key] = (version, records)
         return records
     
     def get_logs_by_timerange(self, start_time: datetime, end_time: datetime) -> List[SmartHomeLogRecord]:
         """Get logs within a time range."""
-        return [r for r in self.log_records 
+        return [r for r in list(self.log_records) 
                 if start_time <= r.timestamp <= end_time]
     
     def get_logs_by_category(self, category: str) -> List[SmartHomeLogRecord]:
         """Get all logs for a specific category."""
-        return [r for r in self.log_records if r.category == category]
+        return [r for r in list(self.log_records) if r.category == category]
     
     def search_logs(self, query: str, case_sensitive: bool = False) -> List[SmartHomeLogRecord]:
         """Search logs by message content."""
-        if not case_sensitive:
-            query = query.lower()
+        records = list(self.log_records)
+        if case_sensitive:
+            return [r for r in records if query in r.message]
         
-        results = []
-        for record in self.log_records:
-            message = record.message if case_sensitive else record.message.lower()
-            if query in message:
-                results.append(record)
-        
-        return results
+        query = query.lower()
+        return [r for r in records if query in r.message_lower]
     
     def export_logs(self, filename: str, format_type: str = "json", 
                    start_time: datetime = None, end_time: datetime = None):
@@ -307,26 +474,27 @@ class SmartHomeLogger:
             end_time = end_time or datetime.max
             records = self.get_logs_by_timerange(start_time, end_time)
         else:
-            records = self.log_records
+            records = list(self.log_records)
         
         try:
             if format_type.lower() == "json":
                 data = [record.to_dict() for record in records]
-                with open(filename, 'w') as f:
-                    json.dump(data, f, indent=2)
+                if ORJSON_AVAILABLE:
+                    with open(filename, 'wb') as f:
+                        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    with open(filename, 'w') as f:
+                        json.dump(data, f, indent=2)
             
             elif format_type.lower() == "csv":
                 import csv
                 with open(filename, 'w', newline='') as f:
                     writer = csv.writer(f)
                     writer.writerow(['Timestamp', 'Level', 'Category', 'Message'])
-                    for record in records:
-                        writer.writerow([
-                            record.timestamp.isoformat(),
-                            record.level,
-                            record.category,
-                            record.message
-                        ])
+                    writer.writerows(
+                        (record.timestamp.isoformat(), record.level, record.category, record.message)
+                        for record in records
+                    )
             
             elif format_type.lower() == "txt":
                 with open(filename, 'w') as f:
@@ -344,28 +512,19 @@ class SmartHomeLogger:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get logging statistics."""
-        total_records = len(self.log_records)
-        
-        # Count by level
-        level_counts = {}
-        category_counts = {}
-        
-        for record in self.log_records:
-            level_counts[record.level] = level_counts.get(record.level, 0) + 1
-            category_counts[record.category] = category_counts.get(record.category, 0) + 1
+        records = self.log_records
+        total_records = len(records)
         
-        # Calculate time range
-        if self.log_records:
-            first_log = min(self.log_records, key=lambda r: r.timestamp)
-            last_log = max(self.log_records, key=lambda r: r.timestamp)
-            time_range = (last_log.timestamp - first_log.timestamp).total_seconds()
+        # Records are stored in logging order, so the ends give the time range
+        if total_records:
+            time_range = (records[-1].timestamp - records[0].timestamp).total_seconds()
         else:
             time_range = 0
         
         return {
             'total_records': total_records,
-            'level_counts': level_counts,
-            'category_counts': category_counts,
+            'level_counts': dict(self._level_counts),
+            'category_counts': dict(self._category_counts),
             'time_range_seconds': time_range,
             'max_records': self.max_records
         }
\ No newline at end of file
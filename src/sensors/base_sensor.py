@@ -32,6 +32,9 @@ class SensorStatus(Enum):
 class SensorEvent:
     """Represents a sensor event with timestamp and data."""
     
+    # Events are created per reading; slots avoid a per-instance __dict__
+    __slots__ = ('sensor_id', 'event_type', 'data', 'timestamp', 'event_id')
+    
     def __init__(self, sensor_id: str, event_type: str, data: Dict[str, Any], 
                  timestamp: Optional[datetime] = None):
         self.sensor_id = sensor_id
@@ -54,6 +57,9 @@ class SensorEvent:
 class BaseSensor(BaseThing):
     """Abstract base class for all sensors, inheriting from BaseThing."""
     
+    # Bumped whenever any sensor's config changes, so cached views of configs can be refreshed
+    config_epoch = 0
+    
     def __init__(self, sensor_id: Optional[str] = None, name: str = "", location: tuple = (0, 0),
                  config: Optional[Dict[str, Any]] = None):
         # Sensor-specific attributes (initialize before calling super)
@@ -73,9 +79,13 @@ class BaseSensor(BaseThing):
         self.last_reading = None
         self.last_update = None
         
+        # Values computed once per simulation tick, shared by the owning engine
+        self.tick_context: Optional[Dict[str, Any]] = None
+        
         # Keep the original event_callbacks for backward compatibility
         # but also use the base Thing event system
         self.event_callbacks = []
+        self._callbacks_snapshot = ()  # tuple copy of event_callbacks used by emit_event
         
         # Security and authentication
         self.security_level = self.config.get('security_level', 'basic')
@@ -92,6 +102,21 @@ class BaseSensor(BaseThing):
         self.accuracy = 0.1
         self.sampling_rate = 1.0  # Hz
         
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Sensor configuration."""
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        self._config = value
+        self._refresh_config()
+        BaseSensor.config_epoch += 1
+    
+    def _refresh_config(self):
+        """Cache config values read on every reading (overridden by sensor types)."""
+        pass
+    
     def get_thing_type(self) -> ThingType:
         """Return the thing type (sensor)."""
         return ThingType.SENSOR
@@ -196,6 +221,8 @@ class BaseSensor(BaseThing):
         try:
             self.validate_config(config)
             self.config.update(config)
+            self._refresh_config()
+            BaseSensor.config_epoch += 1
             self.on_config_updated()
             return True
         except Exception as e:
@@ -230,13 +257,17 @@ class BaseSensor(BaseThing):
         self.authenticated = True
         return True
     
-    def update(self) -> Optional[Dict[str, Any]]:
-        """Update sensor and return reading if status changed."""
+    def update(self, reading: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Update sensor and return reading if status changed.
+        
+        A reading computed elsewhere (e.g. by a batched update) can be passed in
+        instead of calling get_reading().
+        """
         if self.get_sensor_status() != SensorStatus.ACTIVE:
             return None
         
         try:
-            current_reading = self.get_reading()
+            current_reading = reading if reading is not None else self.get_reading()
             
             # Check if reading has changed significantly
             if self.has_significant_change(current_reading):
@@ -266,17 +297,22 @@ class BaseSensor(BaseThing):
     def add_event_callback(self, callback: Callable[[SensorEvent], None]):
         """Add callback function for sensor events."""
         self.event_callbacks.append(callback)
+        self._callbacks_snapshot = tuple(self.event_callbacks)
     
     def remove_event_callback(self, callback: Callable[[SensorEvent], None]):
         """Remove event callback."""
         if callback in self.event_callbacks:
             self.event_callbacks.remove(callback)
+        self._callbacks_snapshot = tuple(self.event_callbacks)
     
     def emit_event(self, event_type: str, data: Dict[str, Any]):
         """Emit a sensor event to all registered callbacks."""
+        callbacks = self._callbacks_snapshot
+        if not callbacks:
+            return
         event = SensorEvent(self.sensor_id, event_type, data)
         
-        for callback in self.event_callbacks:
+        for callback in callbacks:
             try:
                 callback(event)
             except Exception as e:
@@ -344,14 +380,29 @@ class SensorRegistry:
     
     def create_sensor(self, sensor_type: str, **kwargs) -> Optional[BaseSensor]:
         """Create a sensor instance of the specified type."""
-        if sensor_type not in self._sensor_types:
+        sensor_class = self._sensor_types.get(sensor_type)
+        if sensor_class is None:
             return None
         
-        sensor_class = self._sensor_types[sensor_type]
         instance = sensor_class(**kwargs)
         self._instances[instance.sensor_id] = instance
         return instance
     
+    def factory(self, sensor_type: str) -> Optional[Callable[..., BaseSensor]]:
+        """Get a creator for one sensor type, resolved once, for creating many sensors."""
+        sensor_class = self._sensor_types.get(sensor_type)
+        if sensor_class is None:
+            return None
+        
+        instances = self._instances
+        
+        def create(**kwargs) -> BaseSensor:
+            instance = sensor_class(**kwargs)
+            instances[instance.sensor_id] = instance
+            return instance
+        
+        return create
+    
     def get_sensor(self, sensor_id: str) -> Optional[BaseSensor]:
         """Get sensor instance by ID."""
         return self._instances.get(sensor_id)
@@ -4,9 +4,165 @@ Common IoT sensor implementations.
 
 import random
 import math
+import time
+from operator import attrgetter
 from typing import Dict, Any
 from src.sensors.base_sensor import BaseSensor, sensor_registry
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Local UTC offset in seconds, resolved once at import (not updated across DST changes)
+_UTC_OFFSET = time.localtime().tm_gmtoff
+
+
+def _local_hour(timestamp: float = None) -> int:
+    """Local hour of a timestamp (default now) without building a datetime object."""
+    if timestamp is None:
+        timestamp = time.time()
+    return int((timestamp + _UTC_OFFSET) % 86400) // 3600
+
+
+def _is_day_at(timestamp: float = None) -> bool:
+    """Whether a wall-clock timestamp (default now) falls in the daytime hours."""
+    return 6 <= _local_hour(timestamp) <= 18
+
+
+def _tick_time(sensor) -> float:
+    """Wall-clock time for a sensor reading, read once per tick by its engine when available."""
+    context = sensor.tick_context
+    if context and 'now' in context:
+        return context['now']
+    return time.time()
+
+
+def _is_daytime(sensor) -> bool:
+    """Whether it is day for a sensor, using its engine's tick context when available."""
+    context = sensor.tick_context
+    if context and 'is_day' in context:
+        return context['is_day']
+    return _is_day_at()
+
+
+# Location used when serialized sensor data has none
+_DEFAULT_LOC = (0, 0)
+
+
+def _as_location(location, default=_DEFAULT_LOC) -> tuple:
+    """Return location as a tuple, or default when it is None."""
+    if location is None:
+        return default
+    return location if type(location) is tuple else tuple(location)
+
+
+# Random generator shared by the batched reading kernels
+_rng = np.random.default_rng() if NUMPY_AVAILABLE else None
+
+# Scalar draws stay on the stdlib generator: per call it is as fast as NumPy's
+# for normals and far faster for uniforms, and Numba compiles it natively
+_random = random.random
+_gauss = random.gauss
+_randint = random.randint
+
+
+def _njit(func):
+    """Compile a scalar reading kernel with Numba when it is installed."""
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True)(func)
+    return func
+
+
+# Parallel loop range for group kernels; plain range when they run as Python
+_prange = numba.prange if NUMBA_AVAILABLE else range
+
+
+def _njit_parallel(func):
+    """Compile a sensor-group kernel with Numba, multi-threaded and without the GIL, when installed."""
+    if NUMBA_AVAILABLE:
+        return numba.njit(parallel=True, cache=True, nogil=True)(func)
+    return func
+
+
+@_njit
+def _round1(x):
+    """Round to one decimal place exactly as np.round(x, 1) does (half to even on x * 10).
+
+    Keeps scalar and batched readings identical; also cheaper than round(x, 1),
+    which rounds the decimal value and can disagree with np.round.
+    """
+    return round(x * 10.0) / 10.0
+
+
+@_njit
+def _temperature_kernel(base_temp, accuracy, min_temp, max_temp):
+    """Noisy temperature clamped to the sensor limits."""
+    temperature = base_temp + _gauss(0, accuracy)
+    return _round1(max(min_temp, min(temperature, max_temp)))
+
+
+@_njit
+def _humidity_kernel(base_humidity, accuracy):
+    """Noisy relative humidity clamped to 0-100%."""
+    humidity = base_humidity + _gauss(0, accuracy)
+    return _round1(max(0, min(100, humidity)))
+
+
+@_njit
+def _pressure_kernel(accuracy, min_pressure, max_pressure):
+    """Atmospheric pressure around the standard value, clamped to the sensor limits."""
+    pressure = 1013.25 + _gauss(0, accuracy) + _randint(-50, 50)
+    return _round1(max(min_pressure, min(pressure, max_pressure)))
+
+
+@_njit
+def _light_kernel(base_lux, calibration_offset):
+    """Unrounded lux level with 10% noise around the base level."""
+    return max(0, base_lux + _gauss(0, base_lux * 0.1) + calibration_offset)
+
+
+@_njit
+def _proximity_kernel(min_range, max_range, accuracy):
+    """Unrounded distance, beyond max_range when no object is detected."""
+    if _random() < 0.3:  # 30% chance of no object detected
+        distance = max_range + 1
+    else:
+        distance = _randint(min_range, max_range)
+    return distance + _gauss(0, accuracy)
+
+
+@_njit
+def _smoke_kernel(smoke_level, alarm_active, alarm_probability, smoke_threshold):
+    """Next (smoke_level, alarm_active) state of a smoke sensor."""
+    if _random() < alarm_probability:
+        return _randint(60, 100), True
+    smoke_level = max(0, smoke_level - _randint(1, 5))
+    if smoke_level < smoke_threshold:
+        alarm_active = False
+    return smoke_level, alarm_active
+
+
+@_njit_parallel
+def _temperature_group_kernel(base_temp, accuracy, min_temp, max_temp, noise, out):
+    """Fill out with clamped, rounded temperatures for a whole sensor group."""
+    for i in _prange(out.shape[0]):
+        temperature = base_temp[i] + noise[i] * accuracy[i]
+        out[i] = _round1(max(min_temp[i], min(temperature, max_temp[i])))
+
+
+def gather_batch_arrays(sensors, fields):
+    """Collect cached config attributes of many sensors into one float array per field."""
+    n = len(sensors)
+    return {name: np.fromiter(map(attrgetter(name), sensors), dtype=float, count=n) for name in fields}
+
 
 class TemperatureSensor(BaseSensor):
     """Temperature sensor implementation."""
@@ -24,39 +180,64 @@ class TemperatureSensor(BaseSensor):
             'threshold_change': 0.5
         }
     
+    def _refresh_config(self):
+        """Cache config values read on every reading."""
+        self._base_temp = self.config.get('base_temp', 22.0)
+        self._accuracy = self.config.get('accuracy', 0.5)
+        self._min_temp = self.config.get('min_temp', -40.0)
+        self._max_temp = self.config.get('max_temp', 85.0)
+        self._units = self.config.get('units', 'celsius')
+        self._threshold_change = self.config.get('threshold_change', 0.5)
+    
     def get_reading(self) -> Dict[str, Any]:
-        # Simulate temperature with some realistic variation
-        base_temp = self.config.get('base_temp', 22.0)
-        variation = random.gauss(0, self.config.get('accuracy', 0.5))
-        temperature = base_temp + variation
-        
-        # Clamp to sensor limits
-        temperature = max(self.config.get('min_temp', -40.0),
-                         min(temperature, self.config.get('max_temp', 85.0)))
+        # Simulate temperature with some realistic variation, clamped to sensor limits
+        temperature = _temperature_kernel(self._base_temp, self._accuracy,
+                                          self._min_temp, self._max_temp)
         
         return {
-            'temperature': round(temperature, 1),
-            'units': self.config.get('units', 'celsius'),
-            'accuracy': self.config.get('accuracy', 0.5)
+            'temperature': temperature,
+            'units': self._units,
+            'accuracy': self._accuracy
         }
     
+    # Cached config attributes the batched readings need as arrays
+    batch_fields = ('_accuracy', '_base_temp', '_min_temp', '_max_temp')
+    
+    @classmethod
+    def batch_readings(cls, sensors, arrays=None):
+        """Generate readings for many temperature sensors with vectorized NumPy math."""
+        if arrays is None:
+            arrays = gather_batch_arrays(sensors, cls.batch_fields)
+        
+        n = len(sensors)
+        accuracy = arrays['_accuracy']
+        noise = _rng.standard_normal(n)
+        if NUMBA_AVAILABLE:
+            # Compiled kernel spreads the group across cores
+            temperature = np.empty(n)
+            _temperature_group_kernel(arrays['_base_temp'], accuracy, arrays['_min_temp'],
+                                      arrays['_max_temp'], noise, temperature)
+        else:
+            # In-place ufuncs: one working array, no per-step temporaries
+            temperature = np.multiply(noise, accuracy, out=noise)
+            np.add(temperature, arrays['_base_temp'], out=temperature)
+            np.minimum(temperature, arrays['_max_temp'], out=temperature)
+            np.maximum(temperature, arrays['_min_temp'], out=temperature)
+            np.round(temperature, 1, out=temperature)
+        
+        return [{
+            'temperature': value,
+            'units': sensor._units,
+            'accuracy': sensor._accuracy
+        } for sensor, value in zip(sensors, temperature.tolist())]
+    
     def has_significant_change(self, new_reading: Dict[str, Any]) -> bool:
         if self.last_reading is None:
             return True
         
-        threshold = self.config.get('threshold_change', 0.5)
+        threshold = self._threshold_change
         temp_diff = abs(new_reading['temperature'] - self.last_reading['temperature'])
         return temp_diff >= threshold
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'TemperatureSensor':
-        """Create sensor from dictionary data."""
-        return cls(
-            sensor_id=data.get('sensor_id'),
-            name=data.get('name', ''),
-            location=tuple(data.get('location', [0, 0])),
-            config=data.get('config', {})
-        )
 
 
 class MotionSensor(BaseSensor):
@@ -74,6 +255,13 @@ class MotionSensor(BaseSensor):
             'timeout': 30  # seconds before motion stops
         }
     
+    def _refresh_config(self):
+        """Cache config values read on every reading."""
+        self._trigger_probability = self.config.get('trigger_probability', 0.1)
+        self._timeout = self.config.get('timeout', 30)
+        self._detection_range = self.config.get('detection_range', 5.0)
+        self._sensitivity = self.config.get('sensitivity', 0.7)
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.motion_detected = False
@@ -81,26 +269,59 @@ class MotionSensor(BaseSensor):
     
     def get_reading(self) -> Dict[str, Any]:
         # Simulate motion detection
-        trigger_prob = self.config.get('trigger_probability', 0.1)
+        trigger_prob = self._trigger_probability
         
-        if random.random() < trigger_prob:
+        now = _tick_time(self)
+        
+        if _random() < trigger_prob:
             self.motion_detected = True
-            import time
-            self.last_motion_time = time.time()
+            self.last_motion_time = now
         else:
             # Check if motion timeout has passed
             if self.last_motion_time:
-                import time
-                timeout = self.config.get('timeout', 30)
-                if time.time() - self.last_motion_time > timeout:
+                timeout = self._timeout
+                if now - self.last_motion_time > timeout:
                     self.motion_detected = False
                     self.last_motion_time = None
         
         return {
             'motion_detected': self.motion_detected,
-            'detection_range': self.config.get('detection_range', 5.0),
-            'sensitivity': self.config.get('sensitivity', 0.7)
+            'detection_range': self._detection_range,
+            'sensitivity': self._sensitivity
         }
+    
+    # Cached config attributes the batched readings need as arrays
+    batch_fields = ('_trigger_probability', '_timeout')
+    
+    @classmethod
+    def batch_readings(cls, sensors, arrays=None):
+        """Generate readings for many motion sensors with vectorized NumPy math."""
+        if arrays is None:
+            arrays = gather_batch_arrays(sensors, cls.batch_fields)
+        
+        n = len(sensors)
+        now = _tick_time(sensors[0])
+        triggered = _rng.random(n) < arrays['_trigger_probability']
+        
+        # Motion stops once the timeout has passed since the last trigger (0 = no motion yet)
+        last_motion = np.fromiter((s.last_motion_time or 0.0 for s in sensors), dtype=float, count=n)
+        expired = ~triggered & (last_motion != 0.0) & (now - last_motion > arrays['_timeout'])
+        
+        readings = []
+        for sensor, trigger, expire in zip(sensors, triggered.tolist(), expired.tolist()):
+            if trigger:
+                sensor.motion_detected = True
+                sensor.last_motion_time = now
+            elif expire:
+                sensor.motion_detected = False
+                sensor.last_motion_time = None
+            
+            readings.append({
+                'motion_detected': sensor.motion_detected,
+                'detection_range': sensor._detection_range,
+                'sensitivity': sensor._sensitivity
+            })
+        return readings
 
 
 class DoorWindowSensor(BaseSensor):
@@ -117,6 +338,13 @@ class DoorWindowSensor(BaseSensor):
             'state_change_probability': 0.05  # For simulation
         }
     
+    def _refresh_config(self):
+        """Cache config values read on every reading."""
+        self._state_change_probability = self.config.get('state_change_probability', 0.05)
+        self._tamper_detection = self.config.get('tamper_detection', True)
+        self._contact_type = self.config.get('sensor_type', 'door')
+        self._magnetic_strength = self.config.get('magnetic_strength', 0.8)
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.is_open = False
@@ -124,21 +352,51 @@ class DoorWindowSensor(BaseSensor):
     
     def get_reading(self) -> Dict[str, Any]:
         # Simulate state changes
-        change_prob = self.config.get('state_change_probability', 0.05)
+        change_prob = self._state_change_probability
         
-        if random.random() < change_prob:
+        if _random() < change_prob:
             self.is_open = not self.is_open
         
         # Simulate occasional tamper detection
-        if self.config.get('tamper_detection', True):
-            self.tampered = random.random() < 0.001  # Very low probability
+        if self._tamper_detection:
+            self.tampered = _random() < 0.001  # Very low probability
         
         return {
             'is_open': self.is_open,
-            'sensor_type': self.config.get('sensor_type', 'door'),
+            'sensor_type': self._contact_type,
             'tampered': self.tampered,
-            'magnetic_strength': self.config.get('magnetic_strength', 0.8)
+            'magnetic_strength': self._magnetic_strength
         }
+    
+    # Cached config attributes the batched readings need as arrays
+    batch_fields = ('_state_change_probability', '_tamper_detection')
+    
+    @classmethod
+    def batch_readings(cls, sensors, arrays=None):
+        """Generate readings for many door/window sensors with vectorized NumPy math."""
+        if arrays is None:
+            arrays = gather_batch_arrays(sensors, cls.batch_fields)
+        
+        n = len(sensors)
+        toggled = _rng.random(n) < arrays['_state_change_probability']
+        tamper_checked = arrays['_tamper_detection'] != 0
+        tampered = _rng.random(n) < 0.001  # Very low probability
+        
+        readings = []
+        for sensor, toggle, check, tamper in zip(sensors, toggled.tolist(), tamper_checked.tolist(),
+                                                 tampered.tolist()):
+            if toggle:
+                sensor.is_open = not sensor.is_open
+            if check:
+                sensor.tampered = tamper
+            
+            readings.append({
+                'is_open': sensor.is_open,
+                'sensor_type': sensor._contact_type,
+                'tampered': sensor.tampered,
+                'magnetic_strength': sensor._magnetic_strength
+            })
+        return readings
 
 
 class SmokeSensor(BaseSensor):
@@ -155,6 +413,13 @@ class SmokeSensor(BaseSensor):
             'alarm_probability': 0.001  # Very low for safety simulation
         }
     
+    def _refresh_config(self):
+        """Cache config values read on every reading."""
+        self._test_mode = self.config.get('test_mode', False)
+        self._alarm_probability = self.config.get('alarm_probability', 0.001)
+        self._smoke_threshold = self.config.get('smoke_threshold', 50)
+        self._sensitivity = self.config.get('sensitivity', 'medium')
+    
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.smoke_level = 0
@@ -162,22 +427,55 @@ class SmokeSensor(BaseSensor):
     
     def get_reading(self) -> Dict[str, Any]:
         # Simulate smoke levels
-        if not self.config.get('test_mode', False):
-            alarm_prob = self.config.get('alarm_probability', 0.001)
-            if random.random() < alarm_prob:
-                self.smoke_level = random.randint(60, 100)
-                self.alarm_active = True
-            else:
-                self.smoke_level = max(0, self.smoke_level - random.randint(1, 5))
-                if self.smoke_level < self.config.get('smoke_threshold', 50):
-                    self.alarm_active = False
+        if not self._test_mode:
+            self.smoke_level, self.alarm_active = _smoke_kernel(
+                self.smoke_level, self.alarm_active,
+                self._alarm_probability,
+                self._smoke_threshold)
         
         return {
             'smoke_level': self.smoke_level,
             'alarm_active': self.alarm_active,
-            'threshold': self.config.get('smoke_threshold', 50),
-            'sensitivity': self.config.get('sensitivity', 'medium')
+            'threshold': self._smoke_threshold,
+            'sensitivity': self._sensitivity
         }
+    
+    # Cached config attributes the batched readings need as arrays
+    batch_fields = ('_test_mode', '_alarm_probability', '_smoke_threshold')
+    
+    @classmethod
+    def batch_readings(cls, sensors, arrays=None):
+        """Generate readings for many smoke sensors with vectorized NumPy math."""
+        if arrays is None:
+            arrays = gather_batch_arrays(sensors, cls.batch_fields)
+        
+        n = len(sensors)
+        simulated = arrays['_test_mode'] == 0
+        level = np.fromiter((s.smoke_level for s in sensors), dtype=np.int64, count=n)
+        active = np.fromiter((s.alarm_active for s in sensors), dtype=bool, count=n)
+        
+        # Either a new alarm with a high smoke level, or smoke slowly clearing
+        alarm = _rng.random(n) < arrays['_alarm_probability']
+        cleared = np.maximum(0, level - _rng.integers(1, 5, size=n, endpoint=True))
+        new_level = np.where(alarm, _rng.integers(60, 100, size=n, endpoint=True), cleared)
+        new_active = alarm | (active & (new_level >= arrays['_smoke_threshold']))
+        
+        # Sensors in test mode keep their state
+        level = np.where(simulated, new_level, level)
+        active = np.where(simulated, new_active, active)
+        
+        readings = []
+        for sensor, smoke_level, alarm_active in zip(sensors, level.tolist(), active.tolist()):
+            sensor.smoke_level = smoke_level
+            sensor.alarm_active = alarm_active
+            
+            readings.append({
+                'smoke_level': smoke_level,
+                'alarm_active': alarm_active,
+                'threshold': sensor._smoke_threshold,
+                'sensitivity': sensor._sensitivity
+            })
+        return readings
 
 
 class LightSensor(BaseSensor):
@@ -194,34 +492,66 @@ class LightSensor(BaseSensor):
             'threshold_change': 50  # lux
         }
     
+    def _refresh_config(self):
+        """Cache config values read on every reading."""
+        self._day_night_simulation = self.config.get('day_night_simulation', True)
+        self._max_lux = self.config.get('max_lux', 10000)
+        self._calibration_offset = self.config.get('calibration_offset', 0)
+        self._threshold_change = self.config.get('threshold_change', 50)
+    
     def get_reading(self) -> Dict[str, Any]:
         # Simulate light levels based on time of day
-        if self.config.get('day_night_simulation', True):
-            import datetime
-            hour = datetime.datetime.now().hour
-            
-            if 6 <= hour <= 18:  # Daytime
-                base_lux = random.randint(500, 2000)
+        if self._day_night_simulation:
+            if _is_daytime(self):  # Daytime
+                base_lux = _randint(500, 2000)
             else:  # Nighttime
-                base_lux = random.randint(0, 50)
+                base_lux = _randint(0, 50)
         else:
-            base_lux = random.randint(0, self.config.get('max_lux', 10000))
+            base_lux = _randint(0, self._max_lux)
         
         # Add some variation
-        variation = random.gauss(0, base_lux * 0.1)
-        lux = max(0, base_lux + variation + self.config.get('calibration_offset', 0))
+        lux = _light_kernel(base_lux, self._calibration_offset)
         
         return {
-            'lux': round(lux, 1),
-            'max_lux': self.config.get('max_lux', 10000),
+            'lux': _round1(lux),
+            'max_lux': self._max_lux,
             'is_dark': lux < 50
         }
     
+    # Cached config attributes the batched readings need as arrays
+    batch_fields = ('_max_lux', '_day_night_simulation', '_calibration_offset')
+    
+    @classmethod
+    def batch_readings(cls, sensors, arrays=None):
+        """Generate readings for many light sensors with vectorized NumPy math."""
+        if arrays is None:
+            arrays = gather_batch_arrays(sensors, cls.batch_fields)
+        
+        is_day = _is_daytime(sensors[0])
+        
+        n = len(sensors)
+        max_lux = arrays['_max_lux']
+        simulated = arrays['_day_night_simulation'].astype(bool)
+        
+        # Day/night ranges for simulated sensors, otherwise the full sensor range
+        low = np.where(simulated, 500 if is_day else 0, 0)
+        high = np.where(simulated, 2000 if is_day else 50, max_lux)
+        base_lux = _rng.integers(low, high, endpoint=True).astype(float)
+        
+        variation = _rng.standard_normal(n) * (base_lux * 0.1)
+        lux = np.maximum(0, base_lux + variation + arrays['_calibration_offset'])
+        
+        return [{
+            'lux': value,
+            'max_lux': sensor._max_lux,
+            'is_dark': dark
+        } for sensor, value, dark in zip(sensors, np.round(lux, 1).tolist(), (lux < 50).tolist())]
+    
     def has_significant_change(self, new_reading: Dict[str, Any]) -> bool:
         if self.last_reading is None:
             return True
         
-        threshold = self.config.get('threshold_change', 50)
+        threshold = self._threshold_change
         lux_diff = abs(new_reading['lux'] - self.last_reading['lux'])
         return lux_diff >= threshold
 
@@ -240,26 +570,50 @@ class HumiditySensor(BaseSensor):
             'threshold_change': 2.0
         }
     
+    def _refresh_config(self):
+        """Cache config values read on every reading."""
+        self._base_humidity = self.config.get('base_humidity', 45.0)
+        self._accuracy = self.config.get('accuracy', 2.0)
+        self._threshold_change = self.config.get('threshold_change', 2.0)
+    
     def get_reading(self) -> Dict[str, Any]:
-        # Simulate humidity with realistic variation
-        base_humidity = self.config.get('base_humidity', 45.0)
-        variation = random.gauss(0, self.config.get('accuracy', 2.0))
-        humidity = base_humidity + variation
-        
-        # Clamp to valid range
-        humidity = max(0, min(100, humidity))
+        # Simulate humidity with realistic variation, clamped to valid range
+        humidity = _humidity_kernel(self._base_humidity,
+                                    self._accuracy)
         
         return {
-            'humidity': round(humidity, 1),
+            'humidity': humidity,
             'units': 'percent',
-            'accuracy': self.config.get('accuracy', 2.0)
+            'accuracy': self._accuracy
         }
     
+    # Cached config attributes the batched readings need as arrays
+    batch_fields = ('_accuracy', '_base_humidity')
+    
+    @classmethod
+    def batch_readings(cls, sensors, arrays=None):
+        """Generate readings for many humidity sensors with vectorized NumPy math."""
+        if arrays is None:
+            arrays = gather_batch_arrays(sensors, cls.batch_fields)
+        
+        n = len(sensors)
+        accuracy = arrays['_accuracy']
+        humidity = np.multiply(_rng.standard_normal(n), accuracy)
+        np.add(humidity, arrays['_base_humidity'], out=humidity)
+        np.clip(humidity, 0, 100, out=humidity)
+        np.round(humidity, 1, out=humidity)
+        
+        return [{
+            'humidity': value,
+            'units': 'percent',
+            'accuracy': sensor._accuracy
+        } for sensor, value in zip(sensors, humidity.tolist())]
+    
     def has_significant_change(self, new_reading: Dict[str, Any]) -> bool:
         if self.last_reading is None:
             return True
         
-        threshold = self.config.get('threshold_change', 2.0)
+        threshold = self._threshold_change
         humidity_diff = abs(new_reading['humidity'] - self.last_reading['humidity'])
         return humidity_diff >= threshold
 
@@ -279,21 +633,48 @@ class PressureSensor(BaseSensor):
             'sea_level_correction': True
         }
     
+    def _refresh_config(self):
+        """Cache config values read on every reading."""
+        self._accuracy = self.config.get('accuracy', 1.0)
+        self._min_pressure = self.config.get('min_pressure', 300)
+        self._max_pressure = self.config.get('max_pressure', 1100)
+        self._units = self.config.get('units', 'hPa')
+        self._sea_level_correction = self.config.get('sea_level_correction', True)
+    
     def get_reading(self) -> Dict[str, Any]:
-        # Simulate atmospheric pressure around standard values
-        base_pressure = 1013.25  # Standard atmospheric pressure
-        variation = random.gauss(0, self.config.get('accuracy', 1.0))
-        pressure = base_pressure + variation + random.randint(-50, 50)
-        
-        # Clamp to sensor limits
-        pressure = max(self.config.get('min_pressure', 300),
-                      min(pressure, self.config.get('max_pressure', 1100)))
+        # Simulate atmospheric pressure around standard values, clamped to sensor limits
+        pressure = _pressure_kernel(self._accuracy,
+                                    self._min_pressure,
+                                    self._max_pressure)
         
         return {
-            'pressure': round(pressure, 1),
-            'units': self.config.get('units', 'hPa'),
-            'sea_level_corrected': self.config.get('sea_level_correction', True)
+            'pressure': pressure,
+            'units': self._units,
+            'sea_level_corrected': self._sea_level_correction
         }
+    
+    # Cached config attributes the batched readings need as arrays
+    batch_fields = ('_accuracy', '_min_pressure', '_max_pressure')
+    
+    @classmethod
+    def batch_readings(cls, sensors, arrays=None):
+        """Generate readings for many pressure sensors with vectorized NumPy math."""
+        if arrays is None:
+            arrays = gather_batch_arrays(sensors, cls.batch_fields)
+        
+        n = len(sensors)
+        pressure = np.multiply(_rng.standard_normal(n), arrays['_accuracy'])
+        pressure += 1013.25
+        pressure += _rng.integers(-50, 50, size=n, endpoint=True)
+        np.minimum(pressure, arrays['_max_pressure'], out=pressure)
+        np.maximum(pressure, arrays['_min_pressure'], out=pressure)
+        np.round(pressure, 1, out=pressure)
+        
+        return [{
+            'pressure': value,
+            'units': sensor._units,
+            'sea_level_corrected': sensor._sea_level_correction
+        } for sensor, value in zip(sensors, pressure.tolist())]
 
 
 class ProximitySensor(BaseSensor):
@@ -310,30 +691,57 @@ class ProximitySensor(BaseSensor):
             'detection_angle': 30  # degrees
         }
     
+    def _refresh_config(self):
+        """Cache config values read on every reading."""
+        self._max_range = self.config.get('max_range', 400)
+        self._min_range = self.config.get('min_range', 2)
+        self._accuracy = self.config.get('accuracy', 1.0)
+    
     def get_reading(self) -> Dict[str, Any]:
         # Simulate distance measurement
-        max_range = self.config.get('max_range', 400)
-        min_range = self.config.get('min_range', 2)
-        
-        # Random distance within range, with some probability of no object
-        if random.random() < 0.3:  # 30% chance of no object detected
-            distance = max_range + 1  # Beyond range
-        else:
-            distance = random.randint(min_range, max_range)
+        max_range = self._max_range
+        min_range = self._min_range
         
-        # Add measurement noise
-        accuracy = self.config.get('accuracy', 1.0)
-        noise = random.gauss(0, accuracy)
-        distance += noise
+        # Random distance within range (or beyond it when no object), plus measurement noise
+        distance = _proximity_kernel(min_range, max_range, self._accuracy)
         
         object_detected = distance <= max_range
         
         return {
-            'distance': round(max(0, distance), 1),
+            'distance': _round1(max(0, distance)),
             'object_detected': object_detected,
             'max_range': max_range,
             'units': 'cm'
         }
+    
+    # Cached config attributes the batched readings need as arrays
+    batch_fields = ('_max_range', '_min_range', '_accuracy')
+    
+    @classmethod
+    def batch_readings(cls, sensors, arrays=None):
+        """Generate readings for many proximity sensors with vectorized NumPy math."""
+        if arrays is None:
+            arrays = gather_batch_arrays(sensors, cls.batch_fields)
+        
+        n = len(sensors)
+        max_range = arrays['_max_range']
+        min_range = arrays['_min_range']
+        
+        # 30% chance of no object detected (distance beyond range)
+        no_object = _rng.random(n) < 0.3
+        distance = np.where(no_object, max_range + 1,
+                            _rng.integers(min_range.astype(int), max_range.astype(int), endpoint=True))
+        
+        # Add measurement noise
+        distance = distance + _rng.standard_normal(n) * arrays['_accuracy']
+        
+        return [{
+            'distance': value,
+            'object_detected': detected,
+            'max_range': sensor._max_range,
+            'units': 'cm'
+        } for sensor, value, detected in zip(sensors, np.round(np.maximum(0, distance), 1).tolist(),
+                                             (distance <= max_range).tolist())]
 
 
 # Add from_dict methods to all sensor classes
@@ -344,27 +752,16 @@ def add_from_dict_method(cls):
         return cls_inner(
             sensor_id=data.get('sensor_id'),
             name=data.get('name', ''),
-            location=tuple(data.get('location', [0, 0])),
+            location=_as_location(data.get('location')),
             config=data.get('config', {})
         )
     cls.from_dict = from_dict
     return cls
 
-# Apply to all sensor classes
-MotionSensor = add_from_dict_method(MotionSensor)
-DoorWindowSensor = add_from_dict_method(DoorWindowSensor)
-SmokeSensor = add_from_dict_method(SmokeSensor)
-LightSensor = add_from_dict_method(LightSensor)
-HumiditySensor = add_from_dict_method(HumiditySensor)
-PressureSensor = add_from_dict_method(PressureSensor)
-ProximitySensor = add_from_dict_method(ProximitySensor)
-
-# Register all sensor types
-sensor_registry.register_sensor_type(TemperatureSensor)
-sensor_registry.register_sensor_type(MotionSensor)
-sensor_registry.register_sensor_type(DoorWindowSensor)
-sensor_registry.register_sensor_type(SmokeSensor)
-sensor_registry.register_sensor_type(LightSensor)
-sensor_registry.register_sensor_type(HumiditySensor)
-sensor_registry.register_sensor_type(PressureSensor)
-sensor_registry.register_sensor_type(ProximitySensor)
\ No newline at end of file
+# Built-in sensor types, given from_dict and registered in one pass
+_SENSOR_CLASSES = (TemperatureSensor, MotionSensor, DoorWindowSensor, SmokeSensor,
+                   LightSensor, HumiditySensor, PressureSensor, ProximitySensor)
+
+for _sensor_class in _SENSOR_CLASSES:
+    add_from_dict_method(_sensor_class)
+    sensor_registry.register_sensor_type(_sensor_class)
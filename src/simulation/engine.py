@@ -5,12 +5,24 @@ Main simulation engine that orchestrates the smart home simulation.
 import threading
 import time
 import json
-from typing import Dict, List, Optional, Callable, Any
+import types
+from typing import Dict, List, Optional, Callable, Any, Iterable, Mapping
 from datetime import datetime, timedelta
 from enum import Enum
 
-from src.sensors.base_sensor import BaseSensor, SensorEvent, sensor_registry
-from src.sensors.common_sensors import *
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+from src.sensors.base_sensor import BaseSensor, SensorEvent, SensorStatus, sensor_registry
+# Importing common_sensors also registers the built-in sensor types with sensor_registry
+from src.sensors.common_sensors import NUMPY_AVAILABLE, _as_location, _is_day_at, gather_batch_arrays
+
+
+# Location for template sensors that do not specify one
+_DEFAULT_TEMPLATE_LOC = (100, 100)
 
 
 class SimulationState(Enum):
@@ -20,6 +32,48 @@ class SimulationState(Enum):
     PAUSED = "paused"
 
 
+class _SensorGroup:
+    """Sensors of one class, with their batch parameters kept as NumPy arrays."""
+    
+    def __init__(self, sensor_class: type):
+        self.sensor_class = sensor_class
+        self.sensors: List[BaseSensor] = []
+        self.ids: List[str] = []
+        self.idx: Dict[str, int] = {}  # sensor_id -> position in sensors/ids
+        
+        # Parameter arrays (one per batch field), rebuilt when membership or configs change
+        self._arrays = None
+        self._arrays_epoch = -1
+        
+        # Set once a batch failure has been logged, so the fallback is reported but not every tick
+        self.batch_error_logged = False
+    
+    def add(self, sensor: BaseSensor):
+        """Append a sensor to the group."""
+        self.idx[sensor.sensor_id] = len(self.sensors)
+        self.sensors.append(sensor)
+        self.ids.append(sensor.sensor_id)
+        self._arrays = None
+    
+    def remove(self, sensor_id: str):
+        """Remove a sensor by moving the last sensor into its slot."""
+        i = self.idx.pop(sensor_id)
+        last_sensor = self.sensors.pop()
+        last_id = self.ids.pop()
+        if last_id != sensor_id:
+            self.sensors[i] = last_sensor
+            self.ids[i] = last_id
+            self.idx[last_id] = i
+        self._arrays = None
+    
+    def get_arrays(self) -> Dict[str, Any]:
+        """Get the batch parameter arrays, regathering them only when stale."""
+        if self._arrays is None or self._arrays_epoch != BaseSensor.config_epoch:
+            self._arrays = gather_batch_arrays(self.sensors, self.sensor_class.batch_fields)
+            self._arrays_epoch = BaseSensor.config_epoch
+        return self._arrays
+
+
 class SimulationEngine:
     """Core simulation engine managing sensors, rules, and events."""
     
@@ -29,8 +83,16 @@ class SimulationEngine:
         
         # Core components
         self.sensors = {}  # sensor_id -> BaseSensor
+        self._sensor_groups = {}    # sensor class -> _SensorGroup
+        self._by_type = {}          # sensor type -> [BaseSensor]
+        self._tick_context = {}     # per-tick values shared with all sensors
         self.rules = {}    # rule_id -> Rule
+        
+        # Read-only live views handed out by get_sensors/get_rules
+        self._sensors_view = types.MappingProxyType(self.sensors)
+        self._rules_view = types.MappingProxyType(self.rules)
         self.event_callbacks = []
+        self._callbacks_snapshot = ()  # tuple copy of event_callbacks used for dispatch
         
         # Simulation parameters
         self.simulation_speed = 1.0  # 1.0 = real-time
@@ -41,11 +103,12 @@ class SimulationEngine:
         # Threading
         self.simulation_thread = None
         self.stop_event = threading.Event()
+        self._tick_event = threading.Event()  # set after every simulation tick
         
         # Statistics
         self.total_events = 0
         self.fps_counter = 0
-        self.last_fps_time = time.time()
+        self.last_fps_time = time.monotonic_ns()  # monotonic clock, nanoseconds
         self.current_fps = 0
         
         # Project management
@@ -71,24 +134,9 @@ class SimulationEngine:
     def add_sensor(self, sensor: BaseSensor) -> bool:
         """Add a sensor to the simulation."""
         try:
-            if sensor.sensor_id in self.sensors:
-                self.log_error(f"Sensor {sensor.sensor_id} already exists")
+            if not self._register_sensor(sensor):
                 return False
             
-            # Add event callback to sensor
-            sensor.add_event_callback(self.on_sensor_event)
-            
-            # Store sensor
-            self.sensors[sensor.sensor_id] = sensor
-            
-            # Emit add event
-            self.emit_event("sensor_added", {
-                "sensor_id": sensor.sensor_id,
-                "sensor_type": sensor.get_sensor_type(),
-                "location": sensor.location
-            })
-            
-            self.project_modified = True
             self.log_info(f"Added sensor: {sensor.name} ({sensor.get_sensor_type()})")
             return True
             
@@ -96,6 +144,48 @@ class SimulationEngine:
             self.log_error(f"Failed to add sensor: {str(e)}")
             return False
     
+    def add_sensors(self, sensors: Iterable[BaseSensor]) -> int:
+        """Add several sensors with a single summary log entry. Returns the number added."""
+        added = 0
+        for sensor in sensors:
+            try:
+                if self._register_sensor(sensor):
+                    added += 1
+            except Exception as e:
+                self.log_error(f"Failed to add sensor: {str(e)}")
+        
+        if added:
+            self.log_info(f"Added {added} sensors")
+        return added
+    
+    def _register_sensor(self, sensor: BaseSensor) -> bool:
+        """Store a sensor and wire it into the simulation, without logging the addition."""
+        if sensor.sensor_id in self.sensors:
+            self.log_error(f"Sensor {sensor.sensor_id} already exists")
+            return False
+        
+        # Add event callback to sensor and share the tick context with it
+        sensor.add_event_callback(self.on_sensor_event)
+        sensor.tick_context = self._tick_context
+        
+        # Store sensor
+        self.sensors[sensor.sensor_id] = sensor
+        group = self._sensor_groups.get(type(sensor))
+        if group is None:
+            group = self._sensor_groups[type(sensor)] = _SensorGroup(type(sensor))
+        group.add(sensor)
+        self._by_type.setdefault(sensor.get_sensor_type(), []).append(sensor)
+        
+        # Emit add event
+        self.emit_event("sensor_added", {
+            "sensor_id": sensor.sensor_id,
+            "sensor_type": sensor.get_sensor_type(),
+            "location": sensor.location
+        })
+        
+        self.project_modified = True
+        return True
+    
     def remove_sensor(self, sensor_id: str) -> bool:
         """Remove a sensor from the simulation."""
         try:
@@ -105,8 +195,14 @@ class SimulationEngine:
             
             sensor = self.sensors[sensor_id]
             
-            # Remove from sensors dict
+            # Remove from sensors dict and stop sharing the tick context
             del self.sensors[sensor_id]
+            sensor.tick_context = None
+            group = self._sensor_groups[type(sensor)]
+            group.remove(sensor_id)
+            if not group.sensors:
+                del self._sensor_groups[type(sensor)]
+            self._by_type[sensor.get_sensor_type()].remove(sensor)
             
             # Emit remove event
             self.emit_event("sensor_removed", {
@@ -122,18 +218,25 @@ class SimulationEngine:
             self.log_error(f"Failed to remove sensor: {str(e)}")
             return False
     
+    def _clear_sensors(self):
+        """Drop every sensor, detaching each from the tick context."""
+        for sensor in self.sensors.values():
+            sensor.tick_context = None
+        self.sensors.clear()
+        self._sensor_groups = {}
+        self._by_type = {}
+    
     def get_sensor(self, sensor_id: str) -> Optional[BaseSensor]:
         """Get a sensor by ID."""
         return self.sensors.get(sensor_id)
     
-    def get_sensors(self) -> Dict[str, BaseSensor]:
-        """Get all sensors."""
-        return self.sensors.copy()
+    def get_sensors(self) -> Mapping[str, BaseSensor]:
+        """Get all sensors (read-only live view)."""
+        return self._sensors_view
     
     def get_sensors_by_type(self, sensor_type: str) -> List[BaseSensor]:
         """Get all sensors of a specific type."""
-        return [sensor for sensor in self.sensors.values() 
-                if sensor.get_sensor_type() == sensor_type]
+        return list(self._by_type.get(sensor_type, ()))
     
     def create_sensor_from_template(self, sensor_data: Dict[str, Any]) -> Optional[BaseSensor]:
         """Create a sensor instance from template data."""
@@ -147,8 +250,9 @@ class SimulationEngine:
             sensor = sensor_registry.create_sensor(
                 sensor_type,
                 name=sensor_data.get('name', f"{sensor_type}_sensor"),
-                location=tuple(sensor_data.get('location', [100, 100])),
-                config=sensor_data.get('config', {})
+                location=_as_location(sensor_data.get('location'), _DEFAULT_TEMPLATE_LOC),
+                # Own copy: template data may be shared and read-only
+                config=dict(sensor_data.get('config', {}))
             )
             
             if sensor:
@@ -180,27 +284,32 @@ class SimulationEngine:
         # Placeholder
         return True
     
-    def get_rules(self) -> Dict:
-        """Get all rules."""
-        return self.rules.copy()
+    def get_rules(self) -> Mapping:
+        """Get all rules (read-only live view)."""
+        return self._rules_view
     
     # Event system
     def add_event_callback(self, callback: Callable[[SensorEvent], None]):
         """Add callback for simulation events."""
         self.event_callbacks.append(callback)
+        self._callbacks_snapshot = tuple(self.event_callbacks)
     
     def remove_event_callback(self, callback: Callable[[SensorEvent], None]):
         """Remove event callback."""
         if callback in self.event_callbacks:
             self.event_callbacks.remove(callback)
+        self._callbacks_snapshot = tuple(self.event_callbacks)
     
     def emit_event(self, event_type: str, data: Dict[str, Any]):
         """Emit a simulation event."""
-        event = SensorEvent("simulation", event_type, data)
         self.total_events += 1
+        callbacks = self._callbacks_snapshot
+        if not callbacks:
+            return
+        event = SensorEvent("simulation", event_type, data)
         
         # Call all registered callbacks
-        for callback in self.event_callbacks:
+        for callback in callbacks:
             try:
                 callback(event)
             except Exception as e:
@@ -209,7 +318,7 @@ class SimulationEngine:
     def on_sensor_event(self, event: SensorEvent):
         """Handle events from sensors."""
         # Forward sensor events to simulation callbacks
-        for callback in self.event_callbacks:
+        for callback in self._callbacks_snapshot:
             try:
                 callback(event)
             except Exception as e:
@@ -268,6 +377,9 @@ class SimulationEngine:
         for sensor in self.sensors.values():
             sensor.deactivate()
         
+        # Off-tick readings fall back to live values instead of the last tick's
+        self._tick_context.clear()
+        
         self.emit_event("simulation_stopped", {})
         self.log_info("Simulation stopped")
     
@@ -296,76 +408,120 @@ class SimulationEngine:
         if was_running:
             self.start()
     
+    def wait_for_ticks(self, count: int = 1, timeout: Optional[float] = None) -> bool:
+        """Block until the simulation loop completes count more ticks. Returns False on timeout."""
+        for _ in range(count):
+            self._tick_event.clear()
+            if not self._tick_event.wait(timeout):
+                return False
+        return True
+    
     def _simulation_loop(self):
         """Main simulation loop running in separate thread."""
-        last_update_time = time.time()
+        # One monotonic clock read per iteration, kept in integer nanoseconds
+        last_update_ns = time.monotonic_ns()
         
         while not self.stop_event.is_set() and self.state != SimulationState.STOPPED:
-            loop_start_time = time.time()
+            loop_start_ns = time.monotonic_ns()
             
             # Check if paused
             if self.state == SimulationState.PAUSED:
-                time.sleep(0.1)
+                # Wait on stop_event so stop() wakes the loop immediately
+                self.stop_event.wait(0.1)
                 continue
             
             # Calculate time delta
-            current_time = time.time()
-            time_delta = (current_time - last_update_time) * self.simulation_speed
+            time_delta = (loop_start_ns - last_update_ns) / 1e9 * self.simulation_speed
             
             # Update simulation time
             self.simulation_time += timedelta(seconds=time_delta)
             
             # Update all sensors
             self._update_sensors()
+            self._tick_event.set()
             
             # Update FPS counter
-            self._update_fps_counter()
+            self._update_fps_counter(loop_start_ns)
             
             # Sleep to maintain update interval
-            loop_duration = time.time() - loop_start_time
+            loop_duration = (time.monotonic_ns() - loop_start_ns) / 1e9
             sleep_time = max(0, self.update_interval - loop_duration)
             
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            if sleep_time > 0 and self.stop_event.wait(sleep_time):
+                break
             
-            last_update_time = current_time
+            last_update_ns = loop_start_ns
     
     def _update_sensors(self):
         """Update all sensors in the simulation."""
-        for sensor in self.sensors.values():
-            try:
-                # Update sensor and get reading if changed
-                reading = sensor.update()
-                
-                # Simulate battery drain
-                sensor.simulate_battery_drain(0.001)  # Very slow drain
-                
-            except Exception as e:
-                self.log_error(f"Error updating sensor {sensor.sensor_id}: {str(e)}")
-    
-    def _update_fps_counter(self):
+        # Values every sensor would otherwise compute for itself. Both come from
+        # the wall clock, as off-tick readings do, so a sensor's day/night never
+        # depends on whether it was read inside a tick
+        now = time.time()
+        self._tick_context['now'] = now
+        self._tick_context['is_day'] = _is_day_at(now)
+        
+        for group in list(self._sensor_groups.values()):
+            sensors = group.sensors[:]
+            readings = None
+            
+            # Generate readings for the whole group at once where supported
+            batch_readings = getattr(group.sensor_class, 'batch_readings', None)
+            if NUMPY_AVAILABLE and batch_readings is not None:
+                # Only ACTIVE sensors take a reading; batch kernels update sensor state,
+                # so inactive or failed sensors must not be part of the batch
+                active = [i for i, sensor in enumerate(sensors)
+                          if sensor.get_sensor_status() == SensorStatus.ACTIVE]
+                try:
+                    if len(active) == len(sensors):
+                        readings = batch_readings(sensors, group.get_arrays())
+                    elif active:
+                        arrays = {name: values[active] for name, values in group.get_arrays().items()}
+                        batch = batch_readings([sensors[i] for i in active], arrays)
+                        readings = [None] * len(sensors)
+                        for i, reading in zip(active, batch):
+                            readings[i] = reading
+                except Exception as e:
+                    # Fall back to per-sensor readings so errors are reported per sensor
+                    readings = None
+                    if not group.batch_error_logged:
+                        group.batch_error_logged = True
+                        self.log_error(f"Batch readings failed for {group.sensor_class.__name__}, "
+                                       f"using per-sensor readings: {e}")
+            
+            for i, sensor in enumerate(sensors):
+                try:
+                    # Update sensor and get reading if changed
+                    reading = sensor.update(readings[i] if readings is not None else None)
+                    
+                    # Simulate battery drain
+                    sensor.simulate_battery_drain(0.001)  # Very slow drain
+                    
+                except Exception as e:
+                    self.log_error(f"Error updating sensor {sensor.sensor_id}: {str(e)}")
+    
+    def _update_fps_counter(self, now_ns: Optional[int] = None):
         """Update FPS counter."""
         self.fps_counter += 1
-        current_time = time.time()
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
         
-        if current_time - self.last_fps_time >= 1.0:  # Update every second
-            self.current_fps = self.fps_counter / (current_time - self.last_fps_time)
+        elapsed_ns = now_ns - self.last_fps_time
+        if elapsed_ns >= 1_000_000_000:  # Update every second
+            self.current_fps = self.fps_counter / (elapsed_ns / 1e9)
             self.fps_counter = 0
-            self.last_fps_time = current_time
+            self.last_fps_time = now_ns
     
     # Template and project management
     def load_template(self, template_data: Dict[str, Any]):
         """Load a home template."""
         try:
             # Clear existing sensors
-            self.sensors.clear()
+            self._clear_sensors()
             
             # Load sensors from template
-            for sensor_data in template_data.get('sensors', []):
-                sensor = self.create_sensor(sensor_data)
-                
-                if sensor:
-                    self.add_sensor(sensor)
+            sensors = [self.create_sensor(sensor_data) for sensor_data in template_data.get('sensors', [])]
+            self.add_sensors([sensor for sensor in sensors if sensor])
             
             self.emit_event("template_loaded", {"template": template_data.get('name', 'Unknown')})
             self.log_info(f"Loaded template: {template_data.get('name', 'Unknown')}")
@@ -377,8 +533,9 @@ class SimulationEngine:
         return sensor_registry.create_sensor(
                     sensor_data['type'],
                     name=sensor_data.get('name', f"{sensor_data['type']}_sensor"),
-                    location=tuple(sensor_data.get('location', [100, 100])),
-                    config=sensor_data.get('config', {})
+                    location=_as_location(sensor_data.get('location'), _DEFAULT_TEMPLATE_LOC),
+                    # Own copy: template data may be shared and read-only
+                    config=dict(sensor_data.get('config', {}))
                 )
     
     def save_project(self, filename: str):
@@ -395,8 +552,12 @@ class SimulationEngine:
                 }
             }
             
-            with open(filename, 'w') as f:
-                json.dump(project_data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(project_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(filename, 'w') as f:
+                    json.dump(project_data, f, indent=2)
             
             self.project_modified = False
             self.log_info(f"Project saved to: {filename}")
@@ -408,21 +569,27 @@ class SimulationEngine:
     def load_project(self, filename: str):
         """Load project from file."""
         try:
-            with open(filename, 'r') as f:
-                project_data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(filename, 'rb') as f:
+                    project_data = orjson.loads(f.read())
+            else:
+                with open(filename, 'r') as f:
+                    project_data = json.load(f)
             
             # Clear current state
             self.stop()
-            self.sensors.clear()
+            self._clear_sensors()
             self.rules.clear()
             
             # Load sensors
+            sensor_types = sensor_registry.get_available_types()
+            sensors = []
             for sensor_data in project_data.get('sensors', []):
                 # Recreate sensor from data
-                sensor_class = sensor_registry.get_available_types().get(sensor_data.get('type'))
+                sensor_class = sensor_types.get(sensor_data.get('type'))
                 if sensor_class:
-                    sensor = sensor_class.from_dict(sensor_data)
-                    self.add_sensor(sensor)
+                    sensors.append(sensor_class.from_dict(sensor_data))
+            self.add_sensors(sensors)
             
             # Load settings
             settings = project_data.get('settings', {})
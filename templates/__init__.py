@@ -2,17 +2,34 @@
 Template loading utilities.
 """
 
+import copy
 import json
 import os
+from functools import lru_cache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_TEMPLATE_PATH = os.path.join(os.path.dirname(__file__), 'home_templates.json')
+
+
+@lru_cache(maxsize=4)
+def _load_cached(path, mtime):
+    """Parse a template file; cached per (path, mtime) so edits are picked up."""
+    # One read, then a single in-memory parse
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
 
 def load_templates():
-    """Load templates from JSON file."""
-    template_path = os.path.join(os.path.dirname(__file__), 'home_templates.json')
-    
+    """Load templates from JSON file, reusing the parsed copy until the file changes."""
     try:
-        with open(template_path, 'r') as f:
-            return json.load(f)
+        # Callers get their own copy and may modify it freely
+        return copy.deepcopy(_load_cached(_TEMPLATE_PATH, os.stat(_TEMPLATE_PATH).st_mtime))
     except Exception as e:
         print(f"Error loading templates: {e}")
         return {}
@@ -20,22 +37,20 @@ def load_templates():
 
 def get_template(template_name):
     """Get a specific template by name."""
-    templates = load_templates()
-    return templates.get(template_name)
+    return load_templates().get(template_name)
 
 
 def list_templates():
     """List available templates."""
-    templates = load_templates()
-    return list(templates.keys())
+    return list(load_templates().keys())
 
 
 if __name__ == '__main__':
     # Test the template loading
     templates = load_templates()
     print(f"Loaded {len(templates)} templates:")
-    
+
     for key, template in templates.items():
         print(f"  - {key}: {template.get('name', 'No name')}")
         if 'image' in template:
-            print(f"    Image: {template['image']}")
\ No newline at end of file
+            print(f"    Image: {template['image']}")
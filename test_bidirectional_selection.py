@@ -11,6 +11,7 @@ from src.log_system.logger import SmartHomeLogger
 from src.gui.home_view import HomeView
 from src.gui.sensor_panel import SensorPanel
 from src.sensors.common_sensors import TemperatureSensor, MotionSensor
+from gui_test_support import run_gui
 
 def test_bidirectional_selection():
     """Test bidirectional selection functionality."""
@@ -65,7 +66,7 @@ def test_bidirectional_selection():
     print("🔄 Try selecting sensors in either panel - selection should sync!")
     print("📍 Click sensors in home view or select them in sensor panel")
     
-    root.mainloop()
+    run_gui(root)
 
 if __name__ == "__main__":
     test_bidirectional_selection()
\ No newline at end of file
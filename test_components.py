@@ -4,15 +4,28 @@ Test script for Smart Home Simulation Application
 Verifies basic functionality of core components.
 """
 
+import contextlib
+import io
+import json
 import sys
 import os
+import tempfile
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Add paths for imports
-project_root = os.path.dirname(__file__)
+project_root = os.path.dirname(os.path.abspath(__file__))
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, project_root)
 sys.path.insert(0, src_path)
 
+template_file_path = os.path.join(project_root, 'templates', 'home_templates.json')
+
 def test_sensor_framework():
     """Test sensor creation and basic functionality."""
     print("Testing Sensor Framework...")
@@ -23,11 +36,13 @@ def test_sensor_framework():
     available_types = sensor_registry.get_available_types()
     print(f"Available sensor types: {list(available_types.keys())}")
     
-    # Create test sensors
-    temp_sensor = sensor_registry.create_sensor('temperature', name='Test Temp', location=(100, 200))
-    motion_sensor = sensor_registry.create_sensor('motion', name='Test Motion', location=(150, 250))
+    # Create test sensors through per-type factories, looked up once
+    make_temp = sensor_registry.factory('temperature')
+    make_motion = sensor_registry.factory('motion')
     
-    if temp_sensor and motion_sensor:
+    if make_temp and make_motion:
+        temp_sensor = make_temp(name='Test Temp', location=(100, 200))
+        motion_sensor = make_motion(name='Test Motion', location=(150, 250))
         print("✓ Sensors created successfully")
         
         # Test sensor activation
@@ -66,26 +81,63 @@ def test_simulation_engine():
         sensor_registry.create_sensor('door_window', name='Front Door', location=(25, 100))
     ]
     
-    for sensor in sensors:
-        if sensor:
-            engine.add_sensor(sensor)
+    engine.add_sensors([sensor for sensor in sensors if sensor])
     
     print(f"✓ Added {len(engine.get_sensors())} sensors to simulation")
     
     # Test simulation control
     print("Starting simulation...")
+    engine.set_update_interval(0.1)
     engine.start()
     
-    import time
-    time.sleep(2)  # Run for 2 seconds
+    # Run until the loop has completed two ticks rather than for a fixed time
+    ticked = engine.wait_for_ticks(2, timeout=5.0)
     
     print("Stopping simulation...")
     engine.stop()
+    logger.shutdown()
+    
+    if not ticked:
+        print("✗ Simulation loop did not tick")
+        return False
     
+    print("✓ Simulation loop ticking")
     print("✓ Simulation engine working")
-    logger.shutdown()
     return True
 
+def test_inactive_sensors_keep_state():
+    """Test that simulation ticks leave inactive sensors untouched."""
+    print("\nTesting Inactive Sensor State...")
+    
+    from src.simulation.engine import SimulationEngine
+    from src.sensors.common_sensors import sensor_registry
+    
+    engine = SimulationEngine()
+    sensors = [sensor_registry.create_sensor('door_window', name=f'Door {i}', location=(i, i))
+               for i in range(20)]
+    engine.add_sensors(sensors)
+    
+    # Every other sensor stays active so the batch has to skip the rest
+    for i, sensor in enumerate(sensors):
+        if i % 2:
+            sensor.activate()
+        else:
+            sensor.deactivate()
+    
+    inactive = sensors[::2]
+    before = [(sensor.is_open, sensor.tampered) for sensor in inactive]
+    for _ in range(200):
+        engine._update_sensors()
+    after = [(sensor.is_open, sensor.tampered) for sensor in inactive]
+    
+    if before == after:
+        print(f"✓ {len(inactive)} inactive sensors kept their state over 200 ticks")
+        return True
+    
+    changed = sum(1 for old, new in zip(before, after) if old != new)
+    print(f"✗ {changed} inactive sensors changed state")
+    return False
+
 def test_logging_system():
     """Test logging system functionality."""
     print("\nTesting Logging System...")
@@ -103,28 +155,44 @@ def test_logging_system():
     logger.log_sensor_event("test_sensor", "reading_changed", {"value": 25.5})
     logger.log_security_event("authentication", {"user": "test"}, "info")
     
+    # Records reach the store on the logger's background thread; wait for
+    # the startup message plus the five above before querying
+    deadline = time.monotonic() + 5.0
+    while len(logger.get_recent_logs(10)) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    
     # Get recent logs
     recent_logs = logger.get_recent_logs(10)
-    print(f"✓ Generated {len(recent_logs)} log entries")
     
-    # Test search
+    # Test search (the three level messages and the test_sensor event)
     search_results = logger.search_logs("test")
-    print(f"✓ Found {len(search_results)} logs matching 'test'")
     
     logger.shutdown()
+    
+    if len(recent_logs) != 6:
+        print(f"✗ Expected 6 log entries, got {len(recent_logs)}")
+        return False
+    print(f"✓ Generated {len(recent_logs)} log entries")
+    
+    if len(search_results) != 4:
+        print(f"✗ Expected 4 logs matching 'test', found {len(search_results)}")
+        return False
+    print(f"✓ Found {len(search_results)} logs matching 'test'")
+    
     return True
 
 def test_template_system():
     """Test template loading functionality."""
     print("\nTesting Template System...")
     
-    import json
-    template_file = os.path.join(project_root, 'templates', 'home_templates.json')
+    template_file = template_file_path
     
     if os.path.exists(template_file):
         try:
-            with open(template_file, 'r') as f:
-                templates = json.load(f)
+            # One read, then a single in-memory parse
+            with open(template_file, 'rb') as f:
+                data = f.read()
+            templates = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             
             print(f"✓ Loaded {len(templates)} templates")
             
@@ -141,6 +209,25 @@ def test_template_system():
         print("✗ Template file not found")
         return False
 
+def _run_test(test):
+    """Run one test in a worker process; returns (passed, captured output).
+    
+    SmartHomeLogger writes to ./logs, so each test runs in its own temporary
+    directory and never shares log files with a concurrent worker.
+    """
+    output = io.StringIO()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as work_dir, contextlib.redirect_stdout(output):
+        os.chdir(work_dir)
+        try:
+            passed = bool(test())
+        except Exception as e:
+            print(f"✗ Test failed with exception: {e}")
+            passed = False
+        finally:
+            os.chdir(cwd)
+    return passed, output.getvalue()
+
 def main():
     """Run all tests."""
     print("Smart Home Simulation - Component Tests")
@@ -149,22 +236,22 @@ def main():
     tests = [
         test_sensor_framework,
         test_simulation_engine, 
+        test_inactive_sensors_keep_state,
         test_logging_system,
         test_template_system
     ]
     
-    passed = 0
-    failed = 0
+    # The tests share no state and use no Tk, so run them in parallel processes;
+    # each test's output is buffered and printed in order once it finishes
+    from concurrent.futures import ProcessPoolExecutor
+    results = []
+    with ProcessPoolExecutor(max_workers=len(tests)) as executor:
+        for passed, output in executor.map(_run_test, tests):
+            sys.stdout.write(output)
+            results.append(passed)
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"✗ Test failed with exception: {e}")
-            failed += 1
+    passed = sum(results)
+    failed = len(results) - passed
     
     print("\n" + "=" * 50)
     print(f"Test Results: {passed} passed, {failed} failed")
@@ -6,23 +6,42 @@ Test script to verify template images functionality.
 import sys
 import os
 import json
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk
 
+# Paths resolved once at import
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_TEMPLATE_PATH = os.path.join(_HERE, 'templates', 'home_templates.json')
+_IMAGE_DIR = os.path.join(_HERE, 'resources', 'images', 'houses')
+
 # Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+sys.path.insert(0, os.path.join(_HERE, 'src'))
 
-try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
+
+@lru_cache(maxsize=None)
+def _pil():
+    """Import PIL on first use; returns PIL.Image, or None when Pillow is missing."""
+    try:
+        from PIL import Image
+    except ImportError:
+        print("✗ PIL/Pillow is not available")
+        return None
     print("✓ PIL/Pillow is available")
+    return Image
+
+# Image file extensions, checked with one set lookup per file
+_IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp'})
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    PIL_AVAILABLE = False
-    print("✗ PIL/Pillow is not available")
+    ORJSON_AVAILABLE = False
 
 def test_template_file():
     """Test template JSON file loading."""
-    template_path = os.path.join(os.path.dirname(__file__), 'templates', 'home_templates.json')
+    template_path = _TEMPLATE_PATH
     
     print(f"\nTesting template file: {template_path}")
     
@@ -30,8 +49,10 @@ def test_template_file():
         print("✓ Template file exists")
         
         try:
-            with open(template_path, 'r') as f:
-                templates = json.load(f)
+            # One read, then a single in-memory parse
+            with open(template_path, 'rb') as f:
+                data = f.read()
+            templates = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
             print(f"✓ Template file loaded successfully - {len(templates)} templates found")
             
             for key, template in templates.items():
@@ -48,23 +69,26 @@ def test_template_file():
 
 def test_image_files():
     """Test image file availability."""
-    image_dir = os.path.join(os.path.dirname(__file__), 'resources', 'images', 'houses')
+    image_dir = _IMAGE_DIR
     
     print(f"\nTesting image directory: {image_dir}")
     
     if os.path.exists(image_dir):
         print("✓ Image directory exists")
         
-        image_files = [f for f in os.listdir(image_dir) if f.lower().endswith(('.jpg', '.jpeg', '.png', '.gif', '.bmp'))]
+        # DirEntry carries the path and caches its stat result
+        with os.scandir(image_dir) as it:
+            image_files = [e for e in it if os.path.splitext(e.name)[1].lower() in _IMAGE_EXTS]
         print(f"✓ Found {len(image_files)} image files")
         
-        for img_file in image_files:
-            img_path = os.path.join(image_dir, img_file)
-            print(f"  - {img_file} ({os.path.getsize(img_path)} bytes)")
+        Image = _pil()
+        for entry in image_files:
+            print(f"  - {entry.name} ({entry.stat().st_size} bytes)")
             
-            if PIL_AVAILABLE:
+            if Image is not None:
                 try:
-                    with Image.open(img_path) as img:
+                    # Only the header is read; size and mode need no pixel decode
+                    with Image.open(entry.path) as img:
                         print(f"    Size: {img.size}, Mode: {img.mode}")
                 except Exception as e:
                     print(f"    ✗ Error loading image: {e}")
@@ -73,7 +97,7 @@ def test_image_files():
 
 def test_template_gui():
     """Test template selection GUI with images."""
-    if not PIL_AVAILABLE:
+    if _pil() is None:
         print("\n✗ Cannot test GUI - PIL not available")
         return
         
@@ -5,11 +5,13 @@ import tkinter as tk
 import json
 import os
 import sys
+from functools import lru_cache
 
 # Add the src directory to Python path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 src_path = os.path.join(current_dir, 'src')
-sys.path.insert(0, src_path)
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 from gui.home_view import HomeView
 from log_system.logger import SmartHomeLogger
@@ -38,6 +40,12 @@ class MockSimEngine:
     def __init__(self):
         pass
 
+@lru_cache(maxsize=None)
+def _load_templates(path):
+    """Parse a templates file once per process."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
 def main():
     print("🧪 Sensor Dragging Test")
     print("=" * 30)
@@ -47,19 +55,14 @@ def main():
     print(f"📂 Loading templates from: {templates_path}")
     
     try:
-        with open(templates_path, 'r') as f:
-            templates = json.load(f)
+        templates = _load_templates(templates_path)
         print(f"✅ Loaded {len(templates)} templates")
     except Exception as e:
         print(f"❌ Error loading templates: {e}")
         return
         
     # Find family house template
-    family_template = None
-    for key, template in templates.items():
-        if 'Family House' in template.get('name', ''):
-            family_template = template
-            break
+    family_template = next((t for t in templates.values() if 'Family House' in t.get('name', '')), None)
     
     if not family_template:
         print("❌ Family House template not found!")
@@ -92,8 +95,8 @@ def main():
             MockSensor("smoke1", "Kitchen Smoke", "smoke", 500, 400),
         ]
         
+        home_view.add_sensors(sensors)
         for sensor in sensors:
-            home_view.add_sensor(sensor)
             print(f"📍 Added sensor: {sensor.name} at {sensor.location}")
         
         print("✅ Test setup complete!")